@@ -0,0 +1,94 @@
+"""
+Benchmark: block-DCT bit extraction in TruthMarkDetector
+
+Compares the original per-bit extractor (slice an 8x8 block, cv2.dct, read
+one coefficient) against the batched _LumaPlane extractor at 1MP, 12MP and
+48MP, and checks that both return identical bits.
+
+Usage:
+    python benchmarks/bench_dct_extraction.py [--bits 16000] [--repeat 3]
+"""
+
+import argparse
+import time
+
+import cv2
+import numpy as np
+
+from truthmark.sdk.detector import _LumaPlane
+
+RESOLUTIONS = {
+    "1MP": (1000, 1000),
+    "12MP": (3000, 4000),
+    "48MP": (6000, 8000),
+}
+
+# 15 mid-frequency coefficients per block, as used by the embedder
+MID_FREQUENCIES = [(u, v) for u in range(8) for v in range(8) if 3 <= u + v <= 5][:15]
+
+
+def legacy_extract(channel, locations):
+    """Per-bit extractor as shipped before the batched implementation."""
+    bits = []
+    for block_y, block_x, coef_y, coef_x in locations:
+        block = channel[block_y * 8:block_y * 8 + 8, block_x * 8:block_x * 8 + 8]
+        bits.append(1 if cv2.dct(block)[coef_y, coef_x] > 0 else 0)
+    return bits
+
+
+def batched_extract(channel, locations):
+    plane = _LumaPlane(channel)
+    return (plane.coefficients(locations) > 0).astype(np.uint8).tolist()
+
+
+def make_locations(height, width, bits, rng):
+    """Random blocks, 15 mid-frequency coefficients each (the embedder's layout)."""
+    blocks_h, blocks_w = height // 8, width // 8
+    n_blocks = -(-bits // len(MID_FREQUENCIES))
+    blocks = rng.choice(blocks_h * blocks_w, size=n_blocks, replace=False)
+    locations = []
+    for i in range(bits):
+        block = int(blocks[i // len(MID_FREQUENCIES)])
+        coef_y, coef_x = MID_FREQUENCIES[i % len(MID_FREQUENCIES)]
+        locations.append((block // blocks_w, block % blocks_w, coef_y, coef_x))
+    return locations
+
+
+def best_of(fn, repeat):
+    timings = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--bits", type=int, default=16000, help="Bits to extract (largest payload = 16000)")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+
+    print(f"{'size':>6} | {'legacy (ms)':>12} | {'batched (ms)':>12} | {'speedup':>8} | "
+          f"{'full plane (ms)':>15} | exact")
+    print("-" * 78)
+
+    for name, (height, width) in RESOLUTIONS.items():
+        rgb = rng.integers(0, 256, size=(height, width, 3), dtype=np.uint8)
+        channel = cv2.cvtColor(rgb, cv2.COLOR_RGB2YCrCb)[:, :, 0].astype(np.float32)
+        locations = make_locations(height, width, args.bits, rng)
+
+        legacy_time, legacy_bits = best_of(lambda: legacy_extract(channel, locations), args.repeat)
+        batched_time, batched_bits = best_of(lambda: batched_extract(channel, locations), args.repeat)
+        full_time, _ = best_of(lambda: _LumaPlane(channel).compute_all(), args.repeat)
+
+        exact = "yes" if legacy_bits == batched_bits else "NO"
+        print(f"{name:>6} | {legacy_time * 1e3:12.1f} | {batched_time * 1e3:12.1f} | "
+              f"{legacy_time / batched_time:7.1f}x | {full_time * 1e3:15.1f} | {exact}")
+
+
+if __name__ == "__main__":
+    main()
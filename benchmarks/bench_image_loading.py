@@ -0,0 +1,140 @@
+"""
+Benchmark: per-image I/O in TruthMarkEmbedder.embed
+
+Compares the original load/save path (Image.open + getsize for the input, a
+second Image.open + getsize for JPEG quality estimation, save to disk, then
+Image.open + getsize on the output to report format and size) against the
+single-decode path (load_image, encode to memory, one write). The watermark
+itself is left out; only the I/O around it is measured.
+
+Counts image opens, file opens and path stats per image alongside the time.
+
+Usage:
+    python benchmarks/bench_image_loading.py [--images 20] [--size 2000x1500]
+"""
+
+import argparse
+import io
+import os
+import sys
+import tempfile
+import time
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from truthmark.sdk.image_loader import load_image
+
+COUNTS = Counter()
+_COUNTING = False
+
+
+def _audit(event, args):
+    if _COUNTING and event == "open":
+        COUNTS["file opens"] += 1
+
+
+@contextmanager
+def counting():
+    """Count Image.open calls, file opens and os.stat calls in the block."""
+    global _COUNTING
+    image_open, stat = Image.open, os.stat
+
+    def counted_image_open(*args, **kwargs):
+        COUNTS["image opens"] += 1
+        return image_open(*args, **kwargs)
+
+    def counted_stat(*args, **kwargs):
+        COUNTS["path stats"] += 1
+        return stat(*args, **kwargs)
+
+    Image.open, os.stat = counted_image_open, counted_stat
+    _COUNTING = True
+    try:
+        yield
+    finally:
+        _COUNTING = False
+        Image.open, os.stat = image_open, stat
+
+
+def legacy_roundtrip(src, dst):
+    """I/O of embed as shipped before the loader."""
+    img = Image.open(src)
+    original_format = img.format
+    original_size = os.path.getsize(src)
+
+    # _estimate_jpeg_quality
+    estimate = Image.open(src)
+    _ = os.path.getsize(src) / (estimate.size[0] * estimate.size[1])
+
+    pixels = np.array(img.convert("RGB"))
+    Image.fromarray(pixels).save(str(dst), format=original_format, quality=85)
+
+    output_size = os.path.getsize(dst)
+    output_format = Image.open(dst).format
+    _ = os.path.getsize(dst) / original_size
+    return output_format, output_size
+
+
+def loader_roundtrip(src, dst):
+    """I/O of embed with the single-decode loader."""
+    loaded = load_image(src)
+    _ = loaded.file_size / loaded.pixel_count
+
+    encoded = io.BytesIO()
+    Image.fromarray(loaded.pixels).save(encoded, format=loaded.format, quality=85)
+    with open(dst, "wb") as f:
+        f.write(encoded.getbuffer())
+    return loaded.format, encoded.getbuffer().nbytes
+
+
+def run(fn, sources, out_dir):
+    COUNTS.clear()
+    start = time.perf_counter()
+    with counting():
+        for i, src in enumerate(sources):
+            fn(src, out_dir / f"out_{i}.jpg")
+    elapsed = time.perf_counter() - start
+    return elapsed, dict(COUNTS)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--images", type=int, default=20)
+    parser.add_argument("--size", default="2000x1500", help="WIDTHxHEIGHT")
+    args = parser.parse_args()
+
+    width, height = (int(v) for v in args.size.split("x"))
+    rng = np.random.default_rng(0)
+    sys.addaudithook(_audit)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        sources = []
+        for i in range(args.images):
+            # Smooth gradient plus noise compresses like a photo
+            base = np.linspace(0, 255, width, dtype=np.float32)[None, :, None]
+            noise = rng.normal(0, 12, size=(height, width, 3))
+            pixels = np.clip(base + noise, 0, 255).astype(np.uint8)
+            path = tmp / f"src_{i}.jpg"
+            Image.fromarray(pixels).save(path, quality=90)
+            sources.append(path)
+
+        results = {
+            "legacy": run(legacy_roundtrip, sources, tmp),
+            "loader": run(loader_roundtrip, sources, tmp),
+        }
+
+    n = args.images
+    print(f"{'path':>7} | {'ms/image':>9} | {'image opens':>11} | {'file opens':>10} | {'path stats':>10}")
+    print("-" * 60)
+    for name, (elapsed, counts) in results.items():
+        print(f"{name:>7} | {elapsed / n * 1e3:9.1f} | {counts.get('image opens', 0) / n:11.1f} | "
+              f"{counts.get('file opens', 0) / n:10.1f} | {counts.get('path stats', 0) / n:10.1f}")
+
+
+if __name__ == "__main__":
+    main()
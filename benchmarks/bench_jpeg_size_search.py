@@ -0,0 +1,102 @@
+"""
+Benchmark: JPEG size matching in TruthMarkEmbedder
+
+Counts JPEG encodes per image for the binary and predictive size searches
+used when config.preserve_size is on, and how often each lands within
+config.size_tolerance of the original file size. As in embed(), both searches
+start from the quality _estimate_jpeg_quality guesses from the original file,
+not from the quality it was actually saved at.
+
+Usage:
+    python benchmarks/bench_jpeg_size_search.py [--images 40]
+"""
+
+import argparse
+import io
+import time
+
+import numpy as np
+from PIL import Image
+
+from truthmark.sdk.embedder import TruthMarkEmbedder
+from truthmark.sdk.image_loader import LoadedImage
+from truthmark.core.config import get_config
+
+RESOLUTIONS = [(1024, 768), (1920, 1080), (2048, 1536)]
+
+
+def make_image(width, height, rng):
+    """Smooth gradient plus texture of random strength."""
+    x = np.linspace(0, 255, width)
+    y = np.linspace(0, 255, height)
+    base = (x[None, :] + y[:, None]) / 2
+    noise = rng.normal(0, rng.uniform(2, 30), size=(height, width, 3))
+    pixels = np.clip(base[:, :, None] + noise, 0, 255).astype(np.uint8)
+    return Image.fromarray(pixels)
+
+
+class CountingImage:
+    """Wraps a PIL image and counts save() calls."""
+
+    def __init__(self, img):
+        self._img = img
+        self.saves = 0
+
+    def save(self, *args, **kwargs):
+        self.saves += 1
+        return self._img.save(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._img, name)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--images", type=int, default=40)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    cases = []
+    for i in range(args.images):
+        width, height = RESOLUTIONS[i % len(RESOLUTIONS)]
+        img = make_image(width, height, rng)
+        source_quality = int(rng.integers(72, 95))
+        original = io.BytesIO()
+        img.save(original, format="JPEG", quality=source_quality, subsampling=0)
+        # Watermarking perturbs the content slightly before re-encoding
+        marked = np.clip(np.asarray(img, dtype=np.int16) + rng.integers(-2, 3, size=(height, width, 3)), 0, 255)
+        marked = marked.astype(np.uint8)
+        loaded = LoadedImage(pixels=marked, format="JPEG", file_size=original.tell(), size=(width, height))
+        cases.append((Image.fromarray(marked), loaded))
+
+    config = get_config("balanced")
+    config.preserve_size = True
+
+    print(f"{'search':>10} | {'encodes/image':>13} | {'within tolerance':>16} | {'time (s)':>8}")
+    print("-" * 58)
+
+    for mode in ("binary", "predictive"):
+        embedder = TruthMarkEmbedder(config=config, size_search=mode)
+        search = (
+            embedder._predictive_jpeg_quality if mode == "predictive"
+            else embedder._binary_search_jpeg_quality
+        )
+
+        encodes = 0
+        within = 0
+        start = time.perf_counter()
+        for img, loaded in cases:
+            counting = CountingImage(img)
+            target_size = loaded.file_size
+            settings = {"quality": embedder._estimate_jpeg_quality(loaded), "subsampling": 0}
+            _, encoded = search(counting, target_size, settings)
+            encodes += counting.saves
+            if abs(encoded.getbuffer().nbytes - target_size) <= target_size * config.size_tolerance:
+                within += 1
+        elapsed = time.perf_counter() - start
+
+        print(f"{mode:>10} | {encodes / len(cases):13.2f} | {within:>7}/{len(cases):<8} | {elapsed:8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Benchmark: AsyncTruthMarkClient against a local stand-in API server
+
+Starts an aiohttp server that mimics /v1/decode (with a small simulated
+processing delay), fires N concurrent decodes through one client and
+reports throughput plus the number of distinct sockets the server saw, which
+stays bounded by the client's pool size however many tasks are started.
+
+Usage:
+    python benchmarks/bench_async_client.py [--requests 1000] [--concurrency 32] [--delay 0.01]
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+from aiohttp import web
+
+from truthmark_sdk import AsyncTruthMarkClient
+
+
+class StandInServer:
+    """Minimal TruthMark API stand-in that tracks client connections."""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.peers = set()  # Client (host, port) pairs = distinct sockets
+
+    async def decode(self, request):
+        self.peers.add(request.transport.get_extra_info("peername"))
+        form = await request.post()
+        await asyncio.sleep(self.delay)
+        return web.json_response(
+            {
+                "found": True,
+                "message": "stand-in",
+                "confidence": 1.0,
+                "bytes": len(form["file"].file.read()),
+            }
+        )
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_post("/v1/decode", self.decode)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = runner.addresses[0][1]
+        return runner, f"http://127.0.0.1:{port}"
+
+
+async def run(requests: int, concurrency: int, delay: float, image_path: str):
+    stand_in = StandInServer(delay)
+    runner, base_url = await stand_in.start()
+
+    try:
+        async with AsyncTruthMarkClient(
+            api_key="bench", base_url=base_url, max_concurrency=concurrency
+        ) as client:
+            start = time.perf_counter()
+            results = await asyncio.gather(
+                *(client.decode(image_path) for _ in range(requests)),
+                return_exceptions=True,
+            )
+            elapsed = time.perf_counter() - start
+    finally:
+        await runner.cleanup()
+
+    failures = sum(1 for result in results if isinstance(result, Exception))
+    print(f"decodes:           {requests} ({failures} failed)")
+    print(f"elapsed:           {elapsed:.2f}s ({requests / elapsed:.0f} req/s)")
+    print(f"max concurrency:   {concurrency}")
+    print(f"sockets used:      {len(stand_in.peers)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument(
+        "--delay", type=float, default=0.01, help="Simulated server time per decode (s)"
+    )
+    parser.add_argument("--image-bytes", type=int, default=200_000)
+    args = parser.parse_args()
+
+    with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
+        f.write(os.urandom(args.image_bytes))
+        image_path = f.name
+
+    try:
+        asyncio.run(run(args.requests, args.concurrency, args.delay, image_path))
+    finally:
+        os.unlink(image_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -11,5 +11,8 @@ setup(
         "numpy",
         "opencv-python"
     ],
+    extras_require={
+        "async": ["aiohttp>=3.8"],
+    },
     python_requires=">=3.8",
 )
@@ -0,0 +1,130 @@
+import json
+import threading
+import time
+from email.parser import BytesParser
+from email.policy import HTTP
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+
+def parse_form(content_type, body):
+    """multipart/form-data body -> {name: (filename, bytes)}."""
+    message = BytesParser(policy=HTTP).parsebytes(
+        b"Content-Type: " + content_type.encode("ascii") + b"\r\n\r\n" + body
+    )
+    return {
+        part.get_param("name", header="content-disposition"): (
+            part.get_filename(),
+            part.get_payload(decode=True),
+        )
+        for part in message.iter_parts()
+    }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _read_body(self):
+        if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int(self.rfile.readline().split(b";")[0].strip(), 16)
+                if size == 0:
+                    self.rfile.readline()
+                    return b"".join(chunks)
+                chunks.append(self.rfile.read(size))
+                self.rfile.readline()
+        return self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+    def _send(self, status, body, content_type="application/json"):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        stand_in = self.server.stand_in
+        body = self._read_body()
+        with stand_in.lock:
+            stand_in.peers.add(self.client_address)
+            stand_in.in_flight += 1
+            stand_in.peak_in_flight = max(stand_in.peak_in_flight, stand_in.in_flight)
+            stand_in.requests.append((self.path, dict(self.headers), body))
+        try:
+            form = parse_form(self.headers["Content-Type"], body)
+            data = form["file"][1]
+            # Test inputs steer the response: b"sleep:<s>" delays, b"fail" errors
+            if data.startswith(b"sleep:"):
+                time.sleep(float(data[6:]))
+            if data == b"fail":
+                self._send(500, b'{"error": "stand-in failure"}')
+                return
+            if self.path == "/v1/decode":
+                response = {
+                    "found": True,
+                    "filename": form["file"][0],
+                    "bytes": len(data),
+                }
+            elif self.path == "/v1/encode":
+                response = {
+                    "message": form["message"][1].decode("utf-8"),
+                    "download_url": f"{stand_in.base_url}/download",
+                }
+            else:
+                self._send(404, b"{}")
+                return
+            self._send(200, json.dumps(response).encode("utf-8"))
+        finally:
+            with stand_in.lock:
+                stand_in.in_flight -= 1
+
+    def do_GET(self):
+        stand_in = self.server.stand_in
+        with stand_in.lock:
+            stand_in.peers.add(self.client_address)
+            stand_in.downloads += 1
+        self._send(200, stand_in.download_body, "image/png")
+
+
+class StandInServer:
+    """Local TruthMark API stand-in recording sockets, requests and uploads."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.peers = set()
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.requests = []
+        self.downloads = 0
+        self.download_body = b"WATERMARKED"
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self._server.daemon_threads = True
+        self._server.stand_in = self
+        self.base_url = f"http://127.0.0.1:{self._server.server_port}"
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def form(self, index=-1):
+        """Parsed multipart form of a recorded request."""
+        _, headers, body = self.requests[index]
+        return parse_form(headers["Content-Type"], body)
+
+
+@pytest.fixture
+def server():
+    stand_in = StandInServer()
+    stand_in.start()
+    yield stand_in
+    stand_in.stop()
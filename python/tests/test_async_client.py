@@ -0,0 +1,227 @@
+import asyncio
+import os
+
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+from aiohttp import web  # noqa: E402
+
+from truthmark_sdk import AsyncTruthMarkClient  # noqa: E402
+
+
+class StandInServer:
+    """Local TruthMark API stand-in recording sockets and requests in flight."""
+
+    def __init__(self, delay=0.005):
+        self.delay = delay
+        self.peers = set()
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.completed = 0
+        self.forms = []
+        self.on_request = None
+        self.download_body = b"WATERMARKED"
+
+    async def _handle(self, request):
+        self.peers.add(request.transport.get_extra_info("peername"))
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        if self.on_request is not None:
+            self.on_request()
+        try:
+            form = await request.post()
+            await asyncio.sleep(self.delay)
+            fields = {
+                name: value.file.read() if hasattr(value, "file") else value
+                for name, value in form.items()
+            }
+            self.forms.append(fields)
+            return fields
+        finally:
+            self.in_flight -= 1
+            self.completed += 1
+
+    async def decode(self, request):
+        fields = await self._handle(request)
+        return web.json_response(
+            {"found": True, "confidence": 1.0, "bytes": len(fields["file"])}
+        )
+
+    async def encode(self, request):
+        await self._handle(request)
+        return web.json_response({"download_url": f"{self.base_url}/download"})
+
+    async def download(self, request):
+        return web.Response(body=self.download_body)
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_post("/v1/decode", self.decode)
+        app.router.add_post("/v1/encode", self.encode)
+        app.router.add_get("/download", self.download)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        self.base_url = f"http://127.0.0.1:{self.runner.addresses[0][1]}"
+        return self.base_url
+
+    async def stop(self):
+        await self.runner.cleanup()
+
+
+@pytest.fixture
+def image_path(tmp_path):
+    path = tmp_path / "image.png"
+    path.write_bytes(os.urandom(4096))
+    return str(path)
+
+
+def run_with_server(scenario):
+    async def main():
+        server = StandInServer()
+        base_url = await server.start()
+        try:
+            return server, await scenario(server, base_url)
+        finally:
+            await server.stop()
+
+    return asyncio.run(main())
+
+
+def test_concurrent_decodes_use_bounded_sockets(image_path):
+    async def scenario(server, base_url):
+        async with AsyncTruthMarkClient(
+            api_key="test", base_url=base_url, max_concurrency=8
+        ) as client:
+            return await asyncio.gather(
+                *(client.decode(image_path) for _ in range(1000))
+            )
+
+    server, results = run_with_server(scenario)
+
+    assert len(results) == 1000
+    assert all(
+        result == {"found": True, "confidence": 1.0, "bytes": 4096}
+        for result in results
+    )
+    assert server.peak_in_flight <= 8
+    assert 1 <= len(server.peers) <= 8
+
+
+def test_files_are_opened_only_once_a_slot_is_free(image_path, monkeypatch):
+    import builtins
+
+    real_open = builtins.open
+    opened = []
+    samples = []
+
+    def tracked_open(path, *args, **kwargs):
+        f = real_open(path, *args, **kwargs)
+        if path == image_path:
+            opened.append(f)
+        return f
+
+    async def scenario(server, base_url):
+        # Sampled as each request arrives: (files opened but not yet answered, files held open)
+        server.on_request = lambda: samples.append(
+            (len(opened) - server.completed, sum(not f.closed for f in opened))
+        )
+        monkeypatch.setattr(builtins, "open", tracked_open)
+        async with AsyncTruthMarkClient(
+            api_key="test", base_url=base_url, max_concurrency=4
+        ) as client:
+            return await asyncio.gather(
+                *(client.decode(image_path) for _ in range(100))
+            )
+
+    _, results = run_with_server(scenario)
+
+    assert len(results) == 100
+    assert len(opened) == 100
+    assert all(f.closed for f in opened)
+    assert max(ahead for ahead, _ in samples) <= 4
+    assert 1 <= max(held for _, held in samples) <= 4
+
+
+def test_encode_sends_message_and_downloads_result(image_path, tmp_path):
+    output_path = str(tmp_path / "out.png")
+
+    async def scenario(server, base_url):
+        async with AsyncTruthMarkClient(api_key="test", base_url=base_url) as client:
+            return await client.encode(image_path, "hello", output_path=output_path)
+
+    server, result = run_with_server(scenario)
+
+    assert result["output_path"] == output_path
+    with open(output_path, "rb") as f:
+        assert f.read() == b"WATERMARKED"
+    with open(image_path, "rb") as f:
+        assert server.forms == [{"file": f.read(), "message": "hello"}]
+
+
+def test_download_is_written_off_the_event_loop(image_path, tmp_path, monkeypatch):
+    import builtins
+    import threading
+
+    output_path = str(tmp_path / "out.png")
+    body = os.urandom(1024 * 1024)
+    real_open = builtins.open
+    write_threads = set()
+
+    class RecordingFile:
+        def __init__(self, f):
+            self._f = f
+
+        def write(self, data):
+            write_threads.add(threading.get_ident())
+            return self._f.write(data)
+
+        def close(self):
+            write_threads.add(threading.get_ident())
+            self._f.close()
+
+    def recording_open(path, *args, **kwargs):
+        f = real_open(path, *args, **kwargs)
+        return RecordingFile(f) if path == output_path else f
+
+    async def scenario(server, base_url):
+        server.download_body = body
+        monkeypatch.setattr(builtins, "open", recording_open)
+        async with AsyncTruthMarkClient(
+            api_key="test", base_url=base_url, chunk_size=64 * 1024
+        ) as client:
+            await client.encode(image_path, "hello", output_path=output_path)
+        return threading.get_ident()
+
+    _, loop_thread = run_with_server(scenario)
+
+    with real_open(output_path, "rb") as f:
+        assert f.read() == body
+    assert write_threads
+    assert loop_thread not in write_threads
+
+
+def test_missing_image_raises_value_error(tmp_path):
+    async def scenario(server, base_url):
+        async with AsyncTruthMarkClient(api_key="test", base_url=base_url) as client:
+            with pytest.raises(ValueError):
+                await client.decode(str(tmp_path / "missing.png"))
+
+    run_with_server(scenario)
+
+
+def test_http_errors_are_raised():
+    async def scenario(server, base_url):
+        async with AsyncTruthMarkClient(
+            api_key="test", base_url=base_url + "/missing"
+        ) as client:
+            with pytest.raises(Exception, match="API Request Failed"):
+                await client.decode(__file__)
+
+    run_with_server(scenario)
+
+
+def test_max_concurrency_must_be_positive():
+    with pytest.raises(ValueError):
+        AsyncTruthMarkClient(api_key="test", max_concurrency=0)
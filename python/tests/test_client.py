@@ -0,0 +1,254 @@
+import io
+import threading
+
+import numpy as np
+import pytest
+
+from truthmark_sdk import TruthMarkClient
+
+
+@pytest.fixture
+def image_path(tmp_path):
+    path = tmp_path / "image.png"
+    path.write_bytes(b"\x89PNG\r\n\x1a\n" + bytes(range(256)) * 16)
+    return str(path)
+
+
+def test_sequential_calls_reuse_one_connection(server, image_path):
+    with TruthMarkClient(api_key="test", base_url=server.base_url) as client:
+        results = [client.decode(image_path) for _ in range(20)]
+
+    assert all(result["found"] for result in results)
+    assert len(server.peers) == 1
+
+
+def test_threads_share_one_session_and_pool(server, image_path):
+    sessions = []
+
+    with TruthMarkClient(
+        api_key="test", base_url=server.base_url, pool_maxsize=4
+    ) as client:
+
+        def work():
+            sessions.append(client.session)
+            for _ in range(10):
+                client.decode(image_path)
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert all(session is client.session for session in sessions)
+        assert client.session.get_adapter(server.base_url) is client._adapter
+
+    assert len(server.requests) == 40
+    assert len(server.peers) <= 4
+
+
+def test_requests_carry_the_api_key(server, image_path):
+    with TruthMarkClient(api_key="secret", base_url=server.base_url) as client:
+        client.decode(image_path)
+
+    _, headers, _ = server.requests[0]
+    assert headers["Authorization"] == "Bearer secret"
+
+
+def test_closed_client_rejects_calls(server, image_path):
+    client = TruthMarkClient(api_key="test", base_url=server.base_url)
+    client.close()
+
+    with pytest.raises(RuntimeError):
+        client.decode(image_path)
+
+
+def write_image(tmp_path, name, content):
+    path = tmp_path / name
+    path.write_bytes(content)
+    return str(path)
+
+
+@pytest.fixture
+def bulk_paths(tmp_path):
+    # The first upload is slow, so it finishes after the others
+    return [write_image(tmp_path, "slow.png", b"sleep:0.3")] + [
+        write_image(tmp_path, f"image{index}.png", b"pixels") for index in range(5)
+    ]
+
+
+def test_decode_many_ordered_yields_in_input_order(server, bulk_paths):
+    with TruthMarkClient(api_key="test", base_url=server.base_url) as client:
+        results = list(client.decode_many(bulk_paths, max_concurrency=3, ordered=True))
+
+    assert [result.index for result in results] == list(range(len(bulk_paths)))
+    assert [result.item for result in results] == bulk_paths
+    assert all(result.ok for result in results)
+    assert results[0].result["filename"] == "slow.png"
+
+
+def test_decode_many_unordered_yields_as_completed(server, bulk_paths):
+    with TruthMarkClient(api_key="test", base_url=server.base_url) as client:
+        results = list(client.decode_many(bulk_paths, max_concurrency=3))
+
+    assert sorted(result.index for result in results) == list(range(len(bulk_paths)))
+    assert results[-1].index == 0
+
+
+def test_decode_many_reports_errors_per_item(server, tmp_path):
+    paths = [
+        write_image(tmp_path, "good.png", b"pixels"),
+        str(tmp_path / "missing.png"),
+        write_image(tmp_path, "failing.png", b"fail"),
+        write_image(tmp_path, "also_good.png", b"pixels"),
+    ]
+
+    with TruthMarkClient(api_key="test", base_url=server.base_url) as client:
+        results = list(client.decode_many(paths, ordered=True))
+
+    assert [result.ok for result in results] == [True, False, False, True]
+    assert isinstance(results[1].error, ValueError)
+    assert results[1].result is None
+    assert "API Request Failed" in str(results[2].error)
+    assert results[3].result["filename"] == "also_good.png"
+
+
+def test_encode_many_passes_message_and_output_path(server, tmp_path):
+    items = [
+        (
+            write_image(tmp_path, f"image{index}.png", b"pixels"),
+            f"message {index}",
+            str(tmp_path / f"out{index}.png"),
+        )
+        for index in range(4)
+    ]
+
+    with TruthMarkClient(api_key="test", base_url=server.base_url) as client:
+        results = list(client.encode_many(iter(items), ordered=True))
+
+    for (_, message, output_path), result in zip(items, results):
+        assert result.ok, result.error
+        assert result.result["message"] == message
+        assert result.result["output_path"] == output_path
+        with open(output_path, "rb") as f:
+            assert f.read() == server.download_body
+
+
+def test_bulk_calls_respect_max_concurrency(server, tmp_path):
+    paths = [
+        write_image(tmp_path, f"image{index}.png", b"sleep:0.05") for index in range(12)
+    ]
+
+    with TruthMarkClient(
+        api_key="test", base_url=server.base_url, pool_maxsize=8
+    ) as client:
+        results = list(client.decode_many(paths, max_concurrency=2))
+
+    assert all(result.ok for result in results)
+    assert server.peak_in_flight == 2
+
+
+def test_bulk_calls_reject_non_positive_concurrency(server, image_path):
+    with TruthMarkClient(api_key="test", base_url=server.base_url) as client:
+        with pytest.raises(ValueError):
+            list(client.decode_many([image_path], max_concurrency=-1))
+
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"pixels"
+JPEG = b"\xff\xd8\xff\xe0" + b"pixels"
+
+
+@pytest.mark.parametrize(
+    "image, filename",
+    [
+        (PNG, "image.png"),
+        (bytearray(JPEG), "image.jpg"),
+        (memoryview(PNG), "image.png"),
+        (b"pixels", "image"),
+    ],
+)
+def test_in_memory_bytes_are_uploaded_with_a_guessed_filename(server, image, filename):
+    with TruthMarkClient(api_key="test", base_url=server.base_url) as client:
+        client.decode(image)
+
+    assert server.form()["file"] == (filename, bytes(image))
+
+
+def test_named_file_object_is_uploaded_under_its_basename(server, tmp_path):
+    path = write_image(tmp_path, "photo.jpg", JPEG)
+
+    with TruthMarkClient(api_key="test", base_url=server.base_url) as client:
+        with open(path, "rb") as f:
+            client.decode(f)
+
+    assert server.form()["file"] == ("photo.jpg", JPEG)
+
+
+def test_seekable_stream_is_sniffed_from_its_position(server):
+    stream = io.BytesIO(b"header" + PNG)
+    stream.seek(6)
+
+    with TruthMarkClient(api_key="test", base_url=server.base_url) as client:
+        client.decode(stream)
+
+    assert server.form()["file"] == ("image.png", PNG)
+
+
+class _Unseekable(io.RawIOBase):
+    def __init__(self, data):
+        self._data = io.BytesIO(data)
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        return self._data.readinto(buffer)
+
+
+def test_unseekable_stream_is_uploaded_as_image(server):
+    with TruthMarkClient(api_key="test", base_url=server.base_url) as client:
+        client.decode(_Unseekable(PNG))
+
+    assert server.form()["file"] == ("image", PNG)
+
+
+def test_bgr_array_is_uploaded_as_png(server):
+    cv2 = pytest.importorskip("cv2")
+    Image = pytest.importorskip("PIL.Image")
+    pixels = np.zeros((4, 5, 3), dtype=np.uint8)
+    pixels[..., 0], pixels[..., 1], pixels[..., 2] = 10, 20, 30  # B, G, R
+
+    with TruthMarkClient(api_key="test", base_url=server.base_url) as client:
+        client.decode(pixels)
+
+    filename, data = server.form()["file"]
+    assert filename == "image.png"
+    assert data.startswith(b"\x89PNG")
+    decoded = cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_UNCHANGED)
+    assert np.array_equal(decoded, pixels)
+    # Viewed as RGB, the red channel is the array's last (R) plane
+    rgb = np.asarray(Image.open(io.BytesIO(data)).convert("RGB"))
+    assert np.array_equal(rgb[..., 0], pixels[..., 2])
+
+
+def test_unsupported_input_is_rejected(server):
+    with TruthMarkClient(api_key="test", base_url=server.base_url) as client:
+        with pytest.raises(TypeError):
+            client.decode(12345)
+
+    assert server.requests == []
+
+
+def test_encode_with_output_path_and_bytes_downloads_once(server, image_path, tmp_path):
+    output_path = str(tmp_path / "out.png")
+
+    with TruthMarkClient(api_key="test", base_url=server.base_url) as client:
+        result = client.encode(
+            image_path, "hello", output_path=output_path, return_bytes=True
+        )
+
+    assert server.downloads == 1
+    assert result["image_bytes"] == server.download_body
+    assert result["output_path"] == output_path
+    with open(output_path, "rb") as f:
+        assert f.read() == server.download_body
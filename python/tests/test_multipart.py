@@ -0,0 +1,136 @@
+import io
+
+import pytest
+from conftest import parse_form
+
+from truthmark_sdk import TruthMarkClient
+from truthmark_sdk.multipart import MultipartStream
+
+DATA = bytes(range(256)) * 1024
+
+
+class _Unseekable(io.RawIOBase):
+    def __init__(self, data):
+        self._data = io.BytesIO(data)
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        return self._data.readinto(buffer)
+
+
+def read_all(body, size=4096):
+    chunks = []
+    while True:
+        chunk = body.read(size)
+        if not chunk:
+            return b"".join(chunks)
+        chunks.append(chunk)
+
+
+@pytest.mark.parametrize("as_file", [False, True])
+def test_length_matches_the_streamed_body(tmp_path, as_file):
+    if as_file:
+        path = tmp_path / "image.png"
+        path.write_bytes(DATA)
+        file = open(path, "rb")
+    else:
+        file = DATA
+
+    body = MultipartStream({"message": "hello"}, "file", "image.png", file)
+    data = read_all(body)
+    if as_file:
+        file.close()
+
+    assert body.len == len(data)
+    assert parse_form(body.content_type, data) == {
+        "message": (None, b"hello"),
+        "file": ("image.png", DATA),
+    }
+
+
+def test_length_counts_only_the_rest_of_a_partly_read_file():
+    file = io.BytesIO(DATA)
+    file.seek(1000)
+
+    body = MultipartStream({}, "file", "image.png", file)
+    data = read_all(body)
+
+    assert body.len == len(data)
+    assert parse_form(body.content_type, data)["file"][1] == DATA[1000:]
+
+
+def test_unseekable_file_has_no_length():
+    body = MultipartStream({}, "file", "image", _Unseekable(DATA))
+
+    assert body.len is None
+    assert parse_form(body.content_type, read_all(body))["file"][1] == DATA
+
+
+def test_progress_is_monotonic_and_ends_at_the_total():
+    calls = []
+    body = MultipartStream(
+        {"message": "hello"},
+        "file",
+        "image.png",
+        DATA,
+        progress=lambda sent, total: calls.append((sent, total)),
+    )
+
+    read_all(body, size=10000)
+
+    sent = [call[0] for call in calls]
+    assert sent == sorted(sent)
+    assert len(set(sent)) == len(sent)
+    assert calls[-1] == (body.len, body.len)
+
+
+def test_iteration_yields_the_whole_body():
+    body = MultipartStream({"message": "hello"}, "file", "image.png", DATA)
+    total = body.len
+
+    data = b"".join(body)
+
+    assert len(data) == total
+    assert parse_form(body.content_type, data)["file"] == ("image.png", DATA)
+
+
+def test_names_are_quoted():
+    body = MultipartStream({}, 'fi"le', 'my "photo"\r\n.png', b"pixels")
+
+    header = read_all(body).split(b"\r\n\r\n", 1)[0].decode("utf-8")
+
+    assert 'name="fi%22le"' in header
+    assert 'filename="my %22photo%22.png"' in header
+
+
+def test_client_sends_known_sizes_with_content_length(server, tmp_path):
+    path = tmp_path / "image.png"
+    path.write_bytes(DATA)
+    calls = []
+
+    with TruthMarkClient(api_key="test", base_url=server.base_url) as client:
+        client.decode(
+            str(path), progress=lambda sent, total: calls.append((sent, total))
+        )
+
+    _, headers, body = server.requests[0]
+    assert int(headers["Content-Length"]) == len(body)
+    assert "Transfer-Encoding" not in headers
+    assert calls[-1] == (len(body), len(body))
+
+
+def test_client_sends_unknown_sizes_chunked(server):
+    calls = []
+
+    with TruthMarkClient(api_key="test", base_url=server.base_url) as client:
+        client.decode(
+            _Unseekable(DATA), progress=lambda sent, total: calls.append((sent, total))
+        )
+
+    _, headers, body = server.requests[0]
+    assert headers["Transfer-Encoding"] == "chunked"
+    assert "Content-Length" not in headers
+    assert server.form()["file"][1] == DATA
+    assert calls[-1] == (len(body), None)
@@ -1,3 +1,5 @@
-from .client import TruthMarkClient
+from .async_client import AsyncTruthMarkClient
+from .client import BulkResult, TruthMarkClient
+from .multipart import MultipartStream
 
-__all__ = ["TruthMarkClient"]
+__all__ = ["TruthMarkClient", "AsyncTruthMarkClient", "BulkResult", "MultipartStream"]
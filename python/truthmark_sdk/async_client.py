@@ -0,0 +1,169 @@
+import asyncio
+import os
+from typing import Any, Dict, Optional
+
+try:
+    import aiohttp
+except ImportError:  # Optional dependency: pip install truthmark-sdk[async]
+    aiohttp = None
+
+
+class AsyncTruthMarkClient:
+    """
+    asyncio client for the TruthMark API, with the same encode/decode
+    surface as TruthMarkClient.
+
+    All calls share one aiohttp connection pool. At most max_concurrency
+    requests are in flight at once; further calls wait their turn, so
+    thousands of concurrent tasks use a bounded number of sockets.
+
+    Requires aiohttp (pip install truthmark-sdk[async]).
+
+    Example:
+        async with AsyncTruthMarkClient(api_key="...", max_concurrency=64) as client:
+            results = await asyncio.gather(*(client.decode(p) for p in paths))
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://truthmark-api.onrender.com",
+        max_concurrency: int = 32,
+        pool_size: Optional[int] = None,
+        chunk_size: int = 64 * 1024,
+    ):
+        """
+        Initialize the async TruthMark client.
+
+        Args:
+            api_key: Your API key (currently unused for public beta)
+            base_url: URL of the TruthMark API
+            max_concurrency: Requests in flight at once
+            pool_size: Connections kept in the pool. None = max_concurrency
+            chunk_size: Bytes per chunk when streaming result downloads
+        """
+        if aiohttp is None:
+            raise ImportError(
+                "AsyncTruthMarkClient requires aiohttp: pip install truthmark-sdk[async]"
+            )
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        self.base_url = base_url.rstrip("/")
+        self.api_key = api_key
+        self.headers = {"Authorization": f"Bearer {api_key}"}
+        self.max_concurrency = max_concurrency
+        self.pool_size = pool_size or max_concurrency
+        self.chunk_size = chunk_size
+
+        # Created on first use, inside the running event loop
+        self._session: Optional["aiohttp.ClientSession"] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def __aenter__(self) -> "AsyncTruthMarkClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        """Close the session and its pooled connections."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.pool_size)
+            self._session = aiohttp.ClientSession(connector=connector)
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._session
+
+    async def encode(
+        self, image_path: str, message: str, output_path: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Embed a message into an image via the API.
+
+        Args:
+            image_path: Path to input image
+            message: Text message to embed
+            output_path: Optional path to save result (streamed to disk)
+
+        Returns:
+            Dictionary with metadata and output path
+        """
+        result = await self._post(
+            f"{self.base_url}/v1/encode", image_path, {"message": message}
+        )
+
+        # If output path is provided, download the result
+        if output_path and "download_url" in result:
+            await self._download_image(result["download_url"], output_path)
+            result["output_path"] = output_path
+
+        return result
+
+    async def decode(self, image_path: str) -> Dict[str, Any]:
+        """
+        Extract message from an image via the API.
+
+        Args:
+            image_path: Path to watermarked image
+
+        Returns:
+            Dictionary with extracted message and confidence
+        """
+        return await self._post(f"{self.base_url}/v1/decode", image_path)
+
+    async def _post(
+        self, url: str, image_path: str, fields: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        """Upload the image (plus form fields) and return the JSON response."""
+        if not os.path.exists(image_path):
+            raise ValueError(f"Image not found: {image_path}")
+
+        session = self._get_session()
+        loop = asyncio.get_running_loop()
+        try:
+            async with self._semaphore:
+                # Opened only once a slot is free; aiohttp streams the file
+                # part in chunks (reads run in the executor), so calls
+                # waiting their turn hold no file handles or image data
+                f = await loop.run_in_executor(None, open, image_path, "rb")
+                try:
+                    form = aiohttp.FormData()
+                    form.add_field("file", f, filename=os.path.basename(image_path))
+                    for name, value in (fields or {}).items():
+                        form.add_field(name, value)
+
+                    async with session.post(
+                        url, data=form, headers=self.headers
+                    ) as response:
+                        response.raise_for_status()
+                        return await response.json()
+                finally:
+                    f.close()
+        except aiohttp.ClientError as e:
+            raise Exception(f"API Request Failed: {str(e)}")
+
+    async def _download_image(self, url: str, path: str):
+        """Helper to stream an image from URL to disk"""
+        session = self._get_session()
+        loop = asyncio.get_running_loop()
+        try:
+            async with self._semaphore:
+                async with session.get(url) as response:
+                    response.raise_for_status()
+                    # Disk I/O runs in the executor, like opening uploads,
+                    # so a large result does not stall other requests
+                    f = await loop.run_in_executor(None, open, path, "wb")
+                    try:
+                        async for chunk in response.content.iter_chunked(
+                            self.chunk_size
+                        ):
+                            await loop.run_in_executor(None, f.write, chunk)
+                    finally:
+                        await loop.run_in_executor(None, f.close)
+        except Exception as e:
+            print(f"Warning: Failed to download result image: {e}")
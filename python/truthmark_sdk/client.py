@@ -1,97 +1,382 @@
-from typing import Optional, Dict, Any
 import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
+
+from .multipart import MultipartStream, ProgressCallback
+
+# A path, encoded image data (bytes, bytearray, memoryview or a binary file
+# object), or decoded pixels (NumPy array, OpenCV BGR/BGRA/grayscale order)
+ImageInput = Union[
+    str, "os.PathLike[str]", bytes, bytearray, memoryview, BinaryIO, np.ndarray
+]
+
+# Leading bytes -> upload filename, so the server can tell in-memory images apart
+_IMAGE_SIGNATURES = (
+    (b"\x89PNG\r\n\x1a\n", "image.png"),
+    (b"\xff\xd8\xff", "image.jpg"),
+    (b"GIF8", "image.gif"),
+    (b"II*\x00", "image.tiff"),
+    (b"MM\x00*", "image.tiff"),
+    (b"BM", "image.bmp"),
+)
+
+
+def _guess_filename(head: bytes) -> str:
+    """Upload filename for in-memory image data, from its signature."""
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "image.webp"
+    for signature, filename in _IMAGE_SIGNATURES:
+        if head.startswith(signature):
+            return filename
+    return "image"
+
+
+@contextmanager
+def _image_file(image: ImageInput) -> Iterator[Tuple[str, Any]]:
+    """
+    (filename, data) multipart file entry for an image input.
+
+    Paths are opened, in-memory data is sent as is and arrays are encoded
+    to PNG in memory. No temporary files are written.
+    """
+    if isinstance(image, (str, os.PathLike)):
+        if not os.path.exists(image):
+            raise ValueError(f"Image not found: {image}")
+        with open(image, "rb") as f:
+            yield os.path.basename(image), f
+    elif isinstance(image, (bytes, bytearray)):
+        yield _guess_filename(bytes(image[:12])), image
+    elif isinstance(image, memoryview):
+        yield _guess_filename(image[:12].tobytes()), image
+    elif isinstance(image, np.ndarray):
+        import cv2
+
+        ok, encoded = cv2.imencode(".png", image)
+        if not ok:
+            raise ValueError(f"Could not encode array of shape {image.shape} as PNG")
+        yield "image.png", memoryview(encoded)
+    elif hasattr(image, "read"):
+        name = getattr(image, "name", None)
+        if isinstance(name, str):
+            yield os.path.basename(name), image
+        elif getattr(image, "seekable", lambda: False)():
+            position = image.tell()
+            head = image.read(12)
+            image.seek(position)
+            yield _guess_filename(head), image
+        else:
+            yield "image", image
+    else:
+        raise TypeError(f"Unsupported image input: {type(image).__name__}")
+
+
+class BulkResult(NamedTuple):
+    """Outcome of one item of encode_many/decode_many."""
+
+    index: int  # Position of the item in the input
+    item: Any  # The input item as given
+    result: Optional[Dict[str, Any]]  # API response, None on error
+    error: Optional[Exception]  # Exception raised for this item, None on success
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
 
 class TruthMarkClient:
     """
     Official Python SDK for TruthMark API.
     Embed and extract invisible watermarks using the TruthMark cloud engine.
+
+    Connections are pooled and kept alive between calls, so only the first
+    request to a host pays the TCP/TLS handshake. A client can be shared
+    across threads: all calls go through one requests.Session and its
+    connection pool (the API sets no cookies, so there is no per-call session
+    state to keep apart). Close the client (or use it as a context manager)
+    to release the connections.
+
+    Example:
+        with TruthMarkClient(api_key="...", pool_maxsize=32) as client:
+            result = client.decode("protected.png")
     """
-    
-    def __init__(self, api_key: str, base_url: str = "https://truthmark-api.onrender.com"):
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://truthmark-api.onrender.com",
+        pool_maxsize: int = 10,
+        pool_connections: int = 10,
+    ):
         """
         Initialize the TruthMark client.
-        
+
         Args:
             api_key: Your API key (currently unused for public beta)
             base_url: URL of the TruthMark API
+            pool_maxsize: Keep-alive connections kept per host. Set to the
+                number of threads calling the client concurrently
+            pool_connections: Hosts to keep connection pools for (the API
+                and the result download host)
         """
-        self.base_url = base_url.rstrip('/')
+        self.base_url = base_url.rstrip("/")
         self.api_key = api_key
-        self.headers = {
-            "Authorization": f"Bearer {api_key}"
-        }
+        self.headers = {"Authorization": f"Bearer {api_key}"}
+        self.pool_maxsize = pool_maxsize
+
+        # One session and pool shared by every thread, including the
+        # short-lived workers of encode_many/decode_many
+        self._adapter = HTTPAdapter(
+            pool_connections=pool_connections, pool_maxsize=pool_maxsize
+        )
+        self._session = requests.Session()
+        self._session.mount("https://", self._adapter)
+        self._session.mount("http://", self._adapter)
+        self._closed = False
+
+    def __enter__(self) -> "TruthMarkClient":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
-    def encode(self, image_path: str, message: str, output_path: Optional[str] = None) -> Dict[str, Any]:
+    def close(self):
+        """Close the session and its pooled connections."""
+        self._closed = True
+        self._session.close()
+
+    @property
+    def session(self) -> requests.Session:
+        """The session shared by all threads."""
+        if self._closed:
+            raise RuntimeError("TruthMarkClient is closed")
+        return self._session
+
+    def encode(
+        self,
+        image_path: ImageInput,
+        message: str,
+        output_path: Optional[str] = None,
+        return_bytes: bool = False,
+        progress: Optional[ProgressCallback] = None,
+    ) -> Dict[str, Any]:
         """
         Embed a message into an image via the API.
-        
+
         Args:
-            image_path: Path to input image
+            image_path: Path to input image, or the image itself as bytes,
+                memoryview, binary file object or NumPy array (BGR, as
+                used by OpenCV; sent as PNG)
             message: Text message to embed
             output_path: Optional path to save result
-            
+            return_bytes: Download the result into memory as
+                result['image_bytes'] instead of (or as well as) a file
+            progress: Upload progress callback, called as
+                progress(bytes_sent, total_bytes)
+
         Returns:
             Dictionary with metadata and output path
         """
-        if not os.path.exists(image_path):
-            raise ValueError(f"Image not found: {image_path}")
-            
         url = f"{self.base_url}/v1/encode"
-        
-        with open(image_path, 'rb') as f:
-            files = {'file': f}
-            data = {'message': message}
-            
+
+        with _image_file(image_path) as (filename, f):
+            body = MultipartStream(
+                {"message": message}, "file", filename, f, progress=progress
+            )
+
             try:
-                response = requests.post(url, files=files, data=data, headers=self.headers)
+                response = self._post_stream(url, body)
                 response.raise_for_status()
                 result = response.json()
-                
-                # If output path is provided, download the result
-                if output_path and 'download_url' in result:
-                    self._download_image(result['download_url'], output_path)
-                    result['output_path'] = output_path
-                    
+
+                download_url = result.get("download_url")
+                image_bytes = None
+                if download_url and return_bytes:
+                    image_bytes = self._download_bytes(download_url)
+                    if image_bytes is not None:
+                        result["image_bytes"] = image_bytes
+
+                # If output path is provided, save the result, reusing the
+                # bytes already downloaded rather than fetching it twice
+                if download_url and output_path:
+                    if image_bytes is not None:
+                        with open(output_path, "wb") as out:
+                            out.write(image_bytes)
+                    elif not return_bytes:
+                        self._download_image(download_url, output_path)
+                    result["output_path"] = output_path
+
                 return result
-                
+
             except requests.exceptions.RequestException as e:
                 raise Exception(f"API Request Failed: {str(e)}")
 
-    def decode(self, image_path: str) -> Dict[str, Any]:
+    def decode(
+        self, image_path: ImageInput, progress: Optional[ProgressCallback] = None
+    ) -> Dict[str, Any]:
         """
         Extract message from an image via the API.
-        
+
         Args:
-            image_path: Path to watermarked image
-            
+            image_path: Path to watermarked image, or the image itself as
+                bytes, memoryview, binary file object or NumPy array
+            progress: Upload progress callback, called as
+                progress(bytes_sent, total_bytes)
+
         Returns:
             Dictionary with extracted message and confidence
         """
-        if not os.path.exists(image_path):
-            raise ValueError(f"Image not found: {image_path}")
-            
         url = f"{self.base_url}/v1/decode"
-        
-        with open(image_path, 'rb') as f:
-            files = {'file': f}
-            
+
+        with _image_file(image_path) as (filename, f):
+            body = MultipartStream({}, "file", filename, f, progress=progress)
+
             try:
-                response = requests.post(url, files=files, headers=self.headers)
+                response = self._post_stream(url, body)
                 response.raise_for_status()
                 return response.json()
-                
+
             except requests.exceptions.RequestException as e:
                 raise Exception(f"API Request Failed: {str(e)}")
 
+    def _post_stream(self, url: str, body: MultipartStream) -> requests.Response:
+        """POST a streaming multipart body; the file is read chunk by chunk as it is sent."""
+        headers = dict(self.headers)
+        headers["Content-Type"] = body.content_type
+        return self.session.post(url, data=body, headers=headers)
+
     def _download_image(self, url: str, path: str):
         """Helper to download image from URL"""
         try:
-            response = requests.get(url, stream=True)
+            with self.session.get(url, stream=True) as response:
+                response.raise_for_status()
+                with open(path, "wb") as f:
+                    for chunk in response.iter_content(chunk_size=8192):
+                        f.write(chunk)
+        except Exception as e:
+            print(f"Warning: Failed to download result image: {e}")
+
+    def _download_bytes(self, url: str) -> Optional[bytes]:
+        """Helper to download image from URL into memory"""
+        try:
+            response = self.session.get(url)
             response.raise_for_status()
-            with open(path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            return response.content
         except Exception as e:
             print(f"Warning: Failed to download result image: {e}")
+            return None
+
+    def encode_many(
+        self,
+        items: Iterable[
+            Union[Tuple[ImageInput, str], Tuple[ImageInput, str, Optional[str]]]
+        ],
+        max_concurrency: Optional[int] = None,
+        ordered: bool = False,
+    ) -> Iterator[BulkResult]:
+        """
+        Encode many images concurrently.
+
+        Args:
+            items: (image_path, message) or (image_path, message, output_path)
+                tuples; may be a generator, consumed as slots free up
+            max_concurrency: Requests in flight at once. None = pool_maxsize
+            ordered: Yield in input order. False = as each request finishes
+
+        Yields:
+            BulkResult per item; a failing item carries its exception in
+            error and does not stop the batch
+        """
+        return self._run_many(
+            lambda item: self.encode(*item), items, max_concurrency, ordered
+        )
+
+    def decode_many(
+        self,
+        image_paths: Iterable[ImageInput],
+        max_concurrency: Optional[int] = None,
+        ordered: bool = False,
+    ) -> Iterator[BulkResult]:
+        """
+        Decode many images concurrently.
+
+        Args:
+            image_paths: Paths to watermarked images (may be a generator)
+            max_concurrency: Requests in flight at once. None = pool_maxsize
+            ordered: Yield in input order. False = as each request finishes
+
+        Yields:
+            BulkResult per image; a failing image carries its exception in
+            error and does not stop the batch
+        """
+        return self._run_many(self.decode, image_paths, max_concurrency, ordered)
+
+    def _run_many(
+        self,
+        call: Callable[[Any], Dict[str, Any]],
+        items: Iterable[Any],
+        max_concurrency: Optional[int],
+        ordered: bool,
+    ) -> Iterator[BulkResult]:
+        """Run call over items on a bounded thread pool sharing this client's connections."""
+        max_concurrency = max_concurrency or self.pool_maxsize
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        def run(index: int, item: Any) -> BulkResult:
+            try:
+                return BulkResult(index, item, call(item), None)
+            except Exception as e:
+                return BulkResult(index, item, None, e)
+
+        items = enumerate(items)
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            pending = set()
+            completed: Dict[int, BulkResult] = {}
+            next_index = 0
+            exhausted = False
+
+            while True:
+                # At most max_concurrency requests in flight, and a bounded
+                # number of results held back for in-order delivery
+                while (
+                    not exhausted
+                    and len(pending) < max_concurrency
+                    and len(pending) + len(completed) < 2 * max_concurrency
+                ):
+                    entry = next(items, None)
+                    if entry is None:
+                        exhausted = True
+                        break
+                    pending.add(executor.submit(run, *entry))
+
+                if not pending and not completed:
+                    return
+
+                if pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        bulk_result = future.result()
+                        if ordered:
+                            completed[bulk_result.index] = bulk_result
+                        else:
+                            yield bulk_result
 
+                while next_index in completed:
+                    yield completed.pop(next_index)
+                    next_index += 1
@@ -0,0 +1,155 @@
+import os
+import uuid
+from typing import Any, Callable, Dict, List, Optional, Union
+
+# Called as progress(bytes_sent, total_bytes); total is None when the size is unknown
+ProgressCallback = Callable[[int, Optional[int]], None]
+
+
+class MultipartStream:
+    """
+    Streaming multipart/form-data request body.
+
+    requests builds a `files=` upload in memory before sending it, so a
+    100MB image costs 100MB+ per request in flight. This body is read by
+    requests/urllib3 in chunks instead: form fields and part headers are
+    small byte strings, the file is read from disk (or sliced from an
+    in-memory buffer) only as the socket asks for it, and memory stays flat
+    whatever the file size.
+
+    When the file's remaining size is known (paths, seekable files, bytes)
+    the request carries a Content-Length; otherwise it is sent with chunked
+    transfer encoding.
+
+    Example:
+        with open("scan.tiff", "rb") as f:
+            body = MultipartStream({"message": "..."}, "file", "scan.tiff", f)
+            session.post(url, data=body, headers={"Content-Type": body.content_type})
+    """
+
+    def __init__(
+        self,
+        fields: Dict[str, Any],
+        file_field: str,
+        filename: str,
+        file: Any,
+        file_content_type: str = "application/octet-stream",
+        progress: Optional[ProgressCallback] = None,
+    ):
+        """
+        Initialize stream.
+
+        Args:
+            fields: Form fields sent before the file
+            file_field: Form field name of the file
+            filename: Filename reported for the file
+            file: Binary file object, or bytes/bytearray/memoryview
+            file_content_type: Content type of the file part
+            progress: Called after every chunk with (bytes sent, total)
+        """
+        self.boundary = uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={self.boundary}"
+        self.progress = progress
+
+        head = b"".join(
+            self._part_header(name) + str(value).encode("utf-8") + b"\r\n"
+            for name, value in fields.items()
+        )
+        head += self._part_header(file_field, filename, file_content_type)
+        tail = f"\r\n--{self.boundary}--\r\n".encode("ascii")
+
+        if isinstance(file, (bytes, bytearray, memoryview)):
+            file = memoryview(file).cast("B")
+        file_size = _remaining_size(file)
+
+        self._parts: List[Union[memoryview, Any]] = [
+            memoryview(head),
+            file,
+            memoryview(tail),
+        ]
+        self._sent = 0
+
+        # Read by requests to set Content-Length (None = chunked upload)
+        self.len: Optional[int] = (
+            len(head) + file_size + len(tail) if file_size is not None else None
+        )
+
+    def _part_header(
+        self,
+        name: str,
+        filename: Optional[str] = None,
+        content_type: Optional[str] = None,
+    ) -> bytes:
+        disposition = f'form-data; name="{_quote(name)}"'
+        if filename is not None:
+            disposition += f'; filename="{_quote(filename)}"'
+        header = f"--{self.boundary}\r\nContent-Disposition: {disposition}\r\n"
+        if content_type is not None:
+            header += f"Content-Type: {content_type}\r\n"
+        return (header + "\r\n").encode("utf-8")
+
+    def read(self, size: int = -1) -> bytes:
+        """Read up to size bytes of the body (all remaining if size < 0)."""
+        chunks = []
+        wanted = size
+
+        while self._parts and (wanted < 0 or wanted > 0):
+            part = self._parts[0]
+            if isinstance(part, memoryview):
+                chunk = part if wanted < 0 else part[:wanted]
+                self._parts[0] = part[len(chunk) :]
+                if not len(self._parts[0]):
+                    self._parts.pop(0)
+                chunk = chunk.tobytes()
+            else:
+                chunk = part.read() if wanted < 0 else part.read(wanted)
+                if not chunk:
+                    self._parts.pop(0)
+                    continue
+
+            chunks.append(chunk)
+            if wanted > 0:
+                wanted -= len(chunk)
+
+        data = b"".join(chunks)
+        if data:
+            self._sent += len(data)
+            if self.progress is not None:
+                self.progress(self._sent, self.len)
+        return data
+
+    def __iter__(self):
+        while True:
+            chunk = self.read(64 * 1024)
+            if not chunk:
+                return
+            yield chunk
+
+
+def _quote(value: str) -> str:
+    """Make a name safe inside a quoted Content-Disposition parameter."""
+    return (
+        value.replace("\\", "\\\\")
+        .replace('"', "%22")
+        .replace("\r", "")
+        .replace("\n", "")
+    )
+
+
+def _remaining_size(file: Any) -> Optional[int]:
+    """Bytes left to read from a buffer or file object, None if unknown."""
+    if isinstance(file, memoryview):
+        return file.nbytes
+    try:
+        return os.fstat(file.fileno()).st_size - file.tell()
+    except (AttributeError, OSError, ValueError):
+        pass
+    try:
+        if file.seekable():
+            position = file.tell()
+            end = file.seek(0, os.SEEK_END)
+            file.seek(position)
+            return end - position
+    except (AttributeError, OSError, ValueError):
+        pass
+    return None
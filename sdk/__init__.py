@@ -2,5 +2,12 @@
 
 from .embedder import TruthMarkEmbedder, EmbedResult
 from .detector import TruthMarkDetector, DetectResult
+from .pipeline import EmbedPipeline, StageStats
+from .keyring import KeyRing
+from .cache import CryptoEngineCache, crypto_engine_cache, get_crypto_engine, get_error_correction
 
-__all__ = ["TruthMarkEmbedder", "TruthMarkDetector", "EmbedResult", "DetectResult"]
+__all__ = [
+    "TruthMarkEmbedder", "TruthMarkDetector", "EmbedResult", "DetectResult", "KeyRing",
+    "EmbedPipeline", "StageStats",
+    "CryptoEngineCache", "crypto_engine_cache", "get_crypto_engine", "get_error_correction",
+]
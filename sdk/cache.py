@@ -0,0 +1,165 @@
+"""
+TruthMark Caches - Shared, thread-safe caches for expensive SDK objects
+
+CryptoEngine setup (base64 decode, key schedule) is repeated for every
+detect/embed call that passes a key. The detector and embedder share one
+bounded LRU cache of initialized engines instead. One-shot keys (the
+integrator's per-image keys) bypass it: they would only evict hot keys and
+keep secrets alive.
+
+Reed-Solomon codecs (generator polynomial, GF tables) depend only on the
+number of ECC symbols, so one ErrorCorrection per symbol count is shared by
+every embed and detection in the process.
+
+Example:
+    >>> from truthmark.sdk.cache import crypto_engine_cache
+    >>> crypto_engine_cache.resize(1024)
+    >>> crypto_engine_cache.cache_info()
+    CacheInfo(hits=9120, misses=88, maxsize=1024, currsize=88)
+"""
+
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, NamedTuple
+
+from ..core.crypto import CryptoEngine
+
+if TYPE_CHECKING:
+    from ..core.error_correction import ErrorCorrection
+
+
+class CacheInfo(NamedTuple):
+    """Cache statistics (same fields as functools.lru_cache)."""
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class CryptoEngineCache:
+    """
+    Bounded, thread-safe LRU cache of CryptoEngine instances keyed by key string.
+
+    Engines are built outside the lock, so a slow key setup never blocks
+    lookups of other keys. If two threads miss on the same key at once, the
+    first engine stored wins and both callers get it.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        """
+        Initialize cache.
+
+        Args:
+            maxsize: Maximum number of engines kept (least recently used evicted)
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self._maxsize = maxsize
+        self._engines: "OrderedDict[str, CryptoEngine]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: str) -> CryptoEngine:
+        """
+        Return the engine for a key, initializing it on a miss.
+
+        Args:
+            key: Encryption key (base64)
+
+        Returns:
+            Initialized CryptoEngine
+        """
+        with self._lock:
+            engine = self._engines.get(key)
+            if engine is not None:
+                self._engines.move_to_end(key)
+                self._hits += 1
+                return engine
+            self._misses += 1
+
+        engine = CryptoEngine(key)
+
+        with self._lock:
+            existing = self._engines.get(key)
+            if existing is not None:
+                self._engines.move_to_end(key)
+                return existing
+            self._engines[key] = engine
+            self._evict()
+        return engine
+
+    def resize(self, maxsize: int):
+        """Change the maximum size, evicting least recently used engines if needed."""
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        with self._lock:
+            self._maxsize = maxsize
+            self._evict()
+
+    def clear(self):
+        """Drop all engines and reset statistics."""
+        with self._lock:
+            self._engines.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def cache_info(self) -> CacheInfo:
+        """Hit/miss statistics."""
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._maxsize, len(self._engines))
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            return key in self._engines
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._engines)
+
+    def _evict(self):
+        # Caller holds the lock
+        while len(self._engines) > self._maxsize:
+            self._engines.popitem(last=False)
+
+
+# Process-wide cache shared by the detector and embedder
+crypto_engine_cache = CryptoEngineCache()
+
+
+def get_crypto_engine(key: str) -> CryptoEngine:
+    """Initialized CryptoEngine for a key from the shared cache."""
+    return crypto_engine_cache.get(key)
+
+
+# ErrorCorrection per ecc_symbols; a handful of values at most, so unbounded
+_ecc_codecs: Dict[int, "ErrorCorrection"] = {}
+_ecc_codecs_lock = threading.Lock()
+
+
+def get_error_correction(ecc_symbols: int) -> "ErrorCorrection":
+    """
+    Shared ErrorCorrection codec for a number of ECC symbols.
+
+    Codecs are built under the lock: Reed-Solomon setup may initialize
+    module-level GF tables, which must not happen concurrently. Encode and
+    decode do not mutate the codec, so the instance is shared across threads.
+
+    Args:
+        ecc_symbols: Reed-Solomon ECC symbols (as config.get_ecc_symbols())
+
+    Returns:
+        Initialized ErrorCorrection
+    """
+    codec = _ecc_codecs.get(ecc_symbols)
+    if codec is not None:
+        return codec
+
+    from ..core.error_correction import ErrorCorrection
+
+    with _ecc_codecs_lock:
+        codec = _ecc_codecs.get(ecc_symbols)
+        if codec is None:
+            codec = ErrorCorrection(ecc_symbols=ecc_symbols)
+            _ecc_codecs[ecc_symbols] = codec
+    return codec
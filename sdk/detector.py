@@ -7,14 +7,164 @@ import numpy as np
 import cv2
 from PIL import Image
 from pathlib import Path
-from typing import Union, Optional, Dict, Any, List, Tuple
+from typing import Union, Optional, Dict, Any, List, Tuple, Iterator, Iterable, NamedTuple, Callable
 from dataclasses import dataclass
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+import functools
+import itertools
 import json
+import os
+import threading
+import weakref
 
 from ..core.crypto import CryptoEngine
 from ..core.extractor import WatermarkExtractor
 from ..core.payload import PayloadBuilder
 from ..core.config import TruthMarkConfig, get_config
+from .framing import HEADER_SIZE, FrameHeader, derive_tag_key, parse_header, verify_tag
+from .keyring import KeyRing
+from .cache import get_crypto_engine, get_error_correction
+
+
+def _dct_matrix(size: int) -> np.ndarray:
+    """Orthonormal DCT-II basis, matching cv2.dct scaling."""
+    k = np.arange(size)[:, None]
+    n = np.arange(size)[None, :]
+    basis = np.cos(np.pi * (2 * n + 1) * k / (2 * size)) * np.sqrt(2.0 / size)
+    basis[0, :] /= np.sqrt(2.0)
+    return basis.astype(np.float32)
+
+
+class _LumaPlane:
+    """
+    Y channel of an image with batched, memoized 8x8 block DCTs.
+    
+    The channel is viewed as a (H/8, W/8, 8, 8) block tensor and blocks are
+    transformed in batches as ``D @ B @ D.T`` (two matrix products over all
+    requested blocks at once). The colour conversion runs once per image and
+    every block is transformed at most once, however many payload-size
+    hypotheses read from it.
+    """
+    
+    BLOCK_SIZE = 8
+    
+    # Coefficients closer to zero than this are recomputed with cv2.dct so
+    # that the extracted sign is bit-exact with the per-block implementation.
+    # Float32 rounding differences between the two paths stay below ~3e-4.
+    EXACT_TOLERANCE = 1e-2
+    
+    _DCT = _dct_matrix(BLOCK_SIZE)
+    
+    def __init__(self, channel: np.ndarray):
+        self.channel = channel.astype(np.float32, copy=False)
+        
+        bs = self.BLOCK_SIZE
+        self.blocks_h = self.channel.shape[0] // bs
+        self.blocks_w = self.channel.shape[1] // bs
+        
+        # Zero-copy (blocks_h, blocks_w, 8, 8) view of the channel
+        cropped = self.channel[:self.blocks_h * bs, :self.blocks_w * bs]
+        self.blocks = cropped.reshape(
+            self.blocks_h, bs, self.blocks_w, bs
+        ).transpose(0, 2, 1, 3)
+        
+        # Transformed blocks are stored compactly; _slots maps a block index
+        # to its row in _store (-1 = not computed yet). Only the blocks that
+        # are actually read get transformed, which on large images is a small
+        # fraction of the plane.
+        self._slots = np.full((self.blocks_h, self.blocks_w), -1, dtype=np.int64)
+        self._store = np.empty((0, bs, bs), dtype=np.float32)
+        self._stored = 0
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def from_rgb(cls, img_array: np.ndarray) -> "_LumaPlane":
+        """Build the plane from an RGB image array."""
+        ycrcb = cv2.cvtColor(img_array, cv2.COLOR_RGB2YCrCb)
+        return cls(ycrcb[:, :, 0])
+    
+    @classmethod
+    def _transform(cls, blocks: np.ndarray) -> np.ndarray:
+        """2-D DCT of an (N, 8, 8) stack as two (N*8, 8) x (8, 8) products."""
+        bs = cls.BLOCK_SIZE
+        rows = (blocks.reshape(-1, bs) @ cls._DCT.T).reshape(-1, bs, bs)
+        cols = rows.transpose(0, 2, 1).reshape(-1, bs) @ cls._DCT.T
+        return cols.reshape(-1, bs, bs).transpose(0, 2, 1)
+    
+    def compute_all(self) -> np.ndarray:
+        """Transform every block of the plane and return the (H/8, W/8, 8, 8) DCT tensor."""
+        bs = self.BLOCK_SIZE
+        with self._lock:
+            self._compute_all()
+        return self._store.reshape(self.blocks_h, self.blocks_w, bs, bs)
+    
+    def _compute_all(self):
+        bs = self.BLOCK_SIZE
+        if self._stored < self.blocks_h * self.blocks_w:
+            all_blocks = np.ascontiguousarray(self.blocks).reshape(-1, bs, bs)
+            self._store = np.ascontiguousarray(self._transform(all_blocks))
+            self._stored = len(self._store)
+            self._slots = np.arange(self._stored, dtype=np.int64).reshape(self.blocks_h, self.blocks_w)
+    
+    def coefficients(self, locations: Union[np.ndarray, List[Tuple[int, int, int, int]]]) -> np.ndarray:
+        """
+        Gather DCT coefficients at embedding locations.
+        
+        Args:
+            locations: (N, 4) array or list of (block_y, block_x, coef_y, coef_x)
+            
+        Returns:
+            float32 array of N coefficients
+        """
+        locs = np.asarray(locations, dtype=np.intp).reshape(-1, 4)
+        block_y, block_x, coef_y, coef_x = locs.T
+        
+        with self._lock:
+            slots = self._ensure_blocks(block_y, block_x)
+            values = self._store[slots, coef_y, coef_x]
+        
+        # Borderline coefficients: defer to cv2.dct so signs match exactly
+        for i in np.flatnonzero(np.abs(values) < self.EXACT_TOLERANCE):
+            block = np.ascontiguousarray(self.blocks[block_y[i], block_x[i]])
+            values[i] = cv2.dct(block)[coef_y[i], coef_x[i]]
+        
+        return values
+    
+    def _ensure_blocks(self, block_y: np.ndarray, block_x: np.ndarray) -> np.ndarray:
+        """Transform missing blocks in one batch and return the store slot of every block."""
+        slots = self._slots[block_y, block_x]
+        missing = slots < 0
+        if not missing.any():
+            return slots
+        
+        flat = np.unique(block_y[missing] * self.blocks_w + block_x[missing])
+        by, bx = np.divmod(flat, self.blocks_w)
+        
+        # Grow the compact store geometrically
+        needed = self._stored + len(flat)
+        if needed > len(self._store):
+            grown = np.empty((max(needed, 2 * len(self._store)),) + self._store.shape[1:], dtype=np.float32)
+            grown[:self._stored] = self._store[:self._stored]
+            self._store = grown
+        
+        self._store[self._stored:needed] = self._transform(self.blocks[by, bx])
+        self._slots[by, bx] = np.arange(self._stored, needed)
+        self._stored = needed
+        
+        return self._slots[block_y, block_x]
+
+
+class _Candidate(NamedTuple):
+    """One payload-size hypothesis: the extracted bytes to try decoding."""
+    embedded_size: int
+    data: bytes
+    format_version: int = 0
+    header: Optional[FrameHeader] = None
+
+
+# Stages at which a candidate can be rejected, cheapest first
+REJECTION_STAGES = ("header", "length", "tag", "decrypt", "ecc", "json")
 
 
 @dataclass
@@ -103,14 +253,33 @@ class TruthMarkDetector:
         >>>     config=TruthMarkConfig.from_preset("enterprise")
         >>> )
         >>> result = detector.detect("suspicious_image.jpg")
+        
+        >>> # Test against many customer keys at once
+        >>> detector = TruthMarkDetector(keyring=KeyRing(customer_keys), mode="copyright")
+        >>> result = detector.detect("suspicious_image.jpg")
+        >>> owner = result.extraction_info["key_id"]
     """
     
+    # Candidate embedded sizes in bytes (encrypted payload + 32-byte hash),
+    # fine-grained for small payloads and coarser for large ones
+    EMBEDDED_SIZES_TO_TRY = list(range(100, 500, 4)) + list(range(500, 1000, 20)) + list(range(1000, 2000, 50))
+    
+    # Mid-frequency coefficients used per 8x8 block
+    COEFFICIENTS_PER_BLOCK = 15
+    
+    # Most distinct override keys a batch worker pre-builds engines for
+    MAX_PREPARED_KEYS = 1024
+    
     def __init__(
         self,
         key: Optional[str] = None,
         mode: str = "standard",
         config: Optional[TruthMarkConfig] = None,
         universal: bool = False,  # Backward compatibility
+        incremental_search: bool = False,
+        legacy_search: bool = True,
+        parallelism: int = 1,
+        keyring: Optional[KeyRing] = None,
     ):
         """
         Initialize TruthMark detector.
@@ -120,12 +289,34 @@ class TruthMarkDetector:
             mode: Detection mode ("standard", "social_media", "copyright", "ai_compliance")
             config: TruthMarkConfig object. None = use balanced preset
             universal: Deprecated. Use mode="social_media" instead
+            incremental_search: Extract the bit stream once for the largest
+                feasible payload size and evaluate every smaller size as a
+                prefix of it, instead of re-selecting and re-extracting
+                locations per size
+            legacy_search: Fall back to the brute-force size search for
+                images without a format header. Disable when only framed
+                (version 1+) images need to be detected
+            parallelism: Number of threads evaluating candidate sizes
+                concurrently within one detect() call. 1 = serial. The
+                first successful candidate wins and the rest are cancelled
+            keyring: Keys to try when no single key is given. Candidate
+                bitstreams are extracted once and every key is tried against
+                them; the first key that verifies wins
         """
         # Handle universal mode (deprecated)
         if universal and mode == "standard":
             mode = "social_media"
         
         self.mode = mode
+        self.incremental_search = incremental_search
+        self.legacy_search = legacy_search
+        self.parallelism = max(1, int(parallelism))
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        
+        # Cumulative count of candidates rejected at each stage
+        self.rejection_stats: Counter = Counter()
+        self._stats_lock = threading.Lock()
         
         # Use provided config or create default
         if config is None:
@@ -136,19 +327,28 @@ class TruthMarkDetector:
         self.crypto = None
         self.key = key
         if key:
-            self.crypto = CryptoEngine(key)
+            self.crypto = get_crypto_engine(key)
+        
+        self.keyring = keyring
+        
+        # Prepared engines for override keys (see prepare_keys)
+        self._engines: Dict[str, CryptoEngine] = {}
+        
+        # Derived tag keys per engine; an entry lives only as long as its
+        # engine (instance key, shared cache entry or keyring entry)
+        self._tag_keys: "weakref.WeakKeyDictionary[CryptoEngine, bytes]" = weakref.WeakKeyDictionary()
     
     def detect(
         self,
         input_path: Union[str, Path, np.ndarray],
-        key: Optional[str] = None
+        key: Optional[Union[str, KeyRing]] = None
     ) -> DetectResult:
         """
         Detect watermark in image.
         
         Args:
             input_path: Path to image or numpy array
-            key: Override decryption key for this detection
+            key: Override decryption key or KeyRing for this detection
             
         Returns:
             DetectResult with all information
@@ -162,93 +362,59 @@ class TruthMarkDetector:
                 img = Image.open(input_path)
                 img_array = np.array(img.convert('RGB'))
             
-            # Use provided key or instance key
-            crypto = self.crypto
-            if key and key != self.key:
-                crypto = CryptoEngine(key)
+            # Use provided key/keyring or instance key/keyring
+            engines = self._engines_for(key)
             
-            if not crypto:
+            if not engines:
                 return DetectResult(
                     detected=False,
                     error_message="No decryption key provided. Cannot detect watermark without key.",
                     confidence=0.0
                 )
             
-            # Try to detect watermark by trying different payload sizes
-            # We'll use the same deterministic location algorithm as the embedder
-            from ..core.embedder import WatermarkEmbedder
+            # Colour conversion and block DCTs are shared by every size hypothesis
+            plane = _LumaPlane.from_rgb(img_array)
             
-            height, width = img_array.shape[:2]
+            # Only sizes that fit in the image are worth trying
+            max_bits = plane.blocks_h * plane.blocks_w * self.COEFFICIENTS_PER_BLOCK
+            sizes = [size for size in self.EMBEDDED_SIZES_TO_TRY if size * 8 <= max_bits]
             
-            # Try common payload sizes (in bytes)
-            # We try extracting different total embedded sizes (encrypted + hash)
-            # Start with fine-grained search from small to large sizes
-            embedded_sizes_to_try = list(range(100, 500, 4)) + list(range(500, 1000, 20)) + list(range(1000, 2000, 50))
+            rejections: Counter = Counter(dict.fromkeys(REJECTION_STAGES, 0))
             
-            for embedded_size_bytes in embedded_sizes_to_try:
-                bits_needed = embedded_size_bytes * 8
-                
-                # Check if image is large enough
-                blocks_h = height // 8
-                blocks_w = width // 8
-                max_bits = blocks_h * blocks_w * 15  # 15 mid-freq coefficients per block
-                
-                if bits_needed > max_bits:
-                    continue
-                
-                try:
-                    # Recompute embedding locations using same algorithm
-                    embedding_locations = WatermarkEmbedder._select_embedding_locations(
-                        height, width, bits_needed, saliency_map=None, block_size=8
-                    )
-                    
-                    # Extract raw bits (without ECC or decryption)
-                    ycrcb = cv2.cvtColor(img_array, cv2.COLOR_RGB2YCrCb)
-                    y_channel = ycrcb[:, :, 0].astype(np.float32)
-                    
-                    # Extract bits from DCT coefficients
-                    extracted_bits = self._extract_bits_from_dct(y_channel, embedding_locations[:bits_needed])
-                    
-                    # Convert bits to bytes
-                    extracted_data = WatermarkExtractor._bits_to_bytes(extracted_bits)
-                    
-                    # Try to decrypt (encrypted_data is last N bytes, hash is last 32)
-                    if len(extracted_data) < 32:
-                        continue  # Too short to contain hash
-                    
-                    encrypted_payload = extracted_data[:-32]
-                    integrity_hash = extracted_data[-32:]
-                    
-                    try:
-                        # Decrypt first
-                        decrypted = crypto.decrypt(encrypted_payload, integrity_hash)
-                        
-                        # Apply error correction AFTER decryption
-                        # (matches embedder flow: ECC → Encrypt, so decrypt → ECC decode)
-                        if self.config.use_error_correction:
-                            from ..core.error_correction import ErrorCorrection
-                            ecc = ErrorCorrection(ecc_symbols=self.config.get_ecc_symbols())
-                            decrypted, errors_corrected = ecc.decode(decrypted)
-                        
-                        # Try to parse as JSON
-                        payload_json = decrypted.decode('utf-8')
-                        payload = json.loads(payload_json)
-                        
-                        # Success! We found the watermark
-                        extract_info = {
-                            "bits_extracted": bits_needed,
-                            "payload_size": len(decrypted),
-                            "confidence": 1.0
-                        }
-                        return self._build_result(payload, extract_info)
-                        
-                    except Exception:
-                        # Decryption/ECC/JSON failed, try next size
-                        continue
-                        
-                except Exception:
-                    # Extraction failed, try next size
-                    continue
+            # Framed (versioned) streams declare their own size. An exact
+            # header is proof of a framed image, so if it fails (wrong key,
+            # corruption) it is not retried under ~190 legacy sizes. Legacy
+            # streams whose leading bytes happen to parse as a noisy header,
+            # or declare a body that cannot be read, still get the
+            # brute-force size search after the framed attempt.
+            jobs: Iterator[Callable[[], Optional[_Candidate]]] = iter(())
+            header, framed = self._read_framed_payload(plane, max_bits, rejections)
+            if framed is not None:
+                jobs = iter([lambda: framed])
+            if self.legacy_search and (framed is None or not header.exact):
+                jobs = itertools.chain(jobs, self._size_hypotheses(plane, sizes))
+            
+            try:
+                if self.parallelism > 1:
+                    found = self._evaluate_parallel(engines, jobs, rejections)
+                else:
+                    found = self._evaluate_serial(engines, jobs, rejections)
+            finally:
+                self._record_rejections(rejections)
+            
+            if found is not None:
+                # Success! We found the watermark
+                candidate, (key_id, payload, decrypted) = found
+                extract_info = {
+                    "bits_extracted": candidate.embedded_size * 8,
+                    "payload_size": len(decrypted),
+                    "format_version": candidate.format_version,
+                    "rejections": dict(rejections),
+                    "confidence": 1.0
+                }
+                if key_id is not None:
+                    extract_info["key_id"] = key_id
+                return self._build_result(payload, extract_info)
             
             # No watermark detected with any payload size
             return DetectResult(
@@ -256,58 +422,347 @@ class TruthMarkDetector:
                 error_message="No watermark detected or decryption failed",
                 confidence=0.0,
                 payload=None,
-                extraction_info=None
+                extraction_info={"rejections": dict(rejections)}
             )
             
-            if extracted_payload is None:
-                return DetectResult(
-                    detected=False,
-                    error_message="No watermark found or decryption failed"
-                )
-            
-            # Apply error correction if enabled
-            if self.config.use_error_correction:
-                from ..core.error_correction import ErrorCorrection
-                ecc = ErrorCorrection(ecc_symbols=self.config.get_ecc_symbols())
-                try:
-                    extracted_payload = ecc.decode(extracted_payload)
-                except Exception as e:
-                    return DetectResult(
-                        detected=False,
-                        error_message=f"Error correction failed: {e}"
-                    )
-            
-            # Decrypt payload
-            if crypto:
-                try:
-                    decrypted = crypto.decrypt(extracted_payload)
-                    payload_json = decrypted.decode('utf-8')
-                    payload = json.loads(payload_json)
-                except Exception as e:
-                    return DetectResult(
-                        detected=False,
-                        error_message=f"Decryption failed: {e}"
-                    )
-            else:
-                # No key provided - raw payload
-                try:
-                    payload_json = extracted_payload.decode('utf-8')
-                    payload = json.loads(payload_json)
-                except Exception:
-                    return DetectResult(
-                        detected=False,
-                        error_message="No decryption key provided"
-                    )
-            
-            # Build result based on mode
-            return self._build_result(payload, extract_info)
-            
         except Exception as e:
             return DetectResult(
                 detected=False,
                 error_message=str(e)
             )
     
+    def _engines_for(self, key: Optional[Union[str, KeyRing]]) -> List[Tuple[Optional[str], CryptoEngine]]:
+        """
+        (key_id, engine) pairs to try, in order.
+        
+        A single key has key_id None; keyring entries carry their id.
+        """
+        if isinstance(key, KeyRing):
+            return key.engines()
+        crypto = self._crypto_for(key)
+        if crypto is not None:
+            return [(None, crypto)]
+        if self.keyring is not None:
+            return self.keyring.engines()
+        return []
+    
+    def _crypto_for(self, key: Optional[str]) -> Optional[CryptoEngine]:
+        """Crypto engine for an override key, falling back to the instance key."""
+        if not key or key == self.key:
+            return self.crypto
+        crypto = self._engines.get(key)
+        if crypto is None:
+            crypto = get_crypto_engine(key)
+        return crypto
+    
+    def prepare_keys(self, keys: List[str]):
+        """
+        Build crypto engines for override keys up front.
+        
+        Prepared engines are pinned on the detector, so they stay available
+        even when the shared LRU engine cache evicts them. Batch workers call
+        this once with the batch's distinct keys.
+        """
+        for key in keys:
+            if key and key != self.key and key not in self._engines:
+                self._engines[key] = get_crypto_engine(key)
+    
+    def _decode_candidate(
+        self,
+        engines: List[Tuple[Optional[str], CryptoEngine]],
+        candidate: _Candidate,
+        rejections: Counter
+    ) -> Optional[Tuple[Optional[str], Dict[str, Any], bytes]]:
+        """
+        Decrypt, error-correct and parse one candidate, cheapest checks first.
+        
+        The same extracted bytes are tried against every key in ``engines``
+        until one verifies. Rejections are counted per stage (and per key) in
+        ``rejections``. Framed candidates with a keyed tag are verified
+        before any decrypt/ECC/JSON work, so a wrong key or corrupted body is
+        discarded without raising.
+        
+        Returns:
+            (key_id, payload, decrypted_bytes), or None if no key decoded it
+        """
+        data = candidate.data
+        
+        # encrypted_data is first N bytes, hash is last 32
+        if len(data) < 32:
+            rejections["length"] += 1
+            return None
+        
+        for key_id, crypto in engines:
+            decoded = self._decode_with_key(crypto, candidate, rejections)
+            if decoded is not None:
+                payload, decrypted = decoded
+                return key_id, payload, decrypted
+        
+        return None
+    
+    def _decode_with_key(
+        self,
+        crypto: CryptoEngine,
+        candidate: _Candidate,
+        rejections: Counter
+    ) -> Optional[Tuple[Dict[str, Any], bytes]]:
+        """Decode one candidate with one key. Returns (payload, decrypted_bytes) or None."""
+        data = candidate.data
+        
+        if candidate.header is not None and not verify_tag(candidate.header, data, self._tag_key_for(crypto)):
+            rejections["tag"] += 1
+            return None
+        
+        try:
+            decrypted = crypto.decrypt(data[:-32], data[-32:])
+        except Exception:
+            rejections["decrypt"] += 1
+            return None
+        
+        # Apply error correction AFTER decryption
+        # (matches embedder flow: ECC → Encrypt, so decrypt → ECC decode)
+        if self.config.use_error_correction:
+            try:
+                ecc = get_error_correction(self.config.get_ecc_symbols())
+                decrypted, errors_corrected = ecc.decode(decrypted)
+            except Exception:
+                rejections["ecc"] += 1
+                return None
+        
+        try:
+            payload = json.loads(decrypted.decode('utf-8'))
+        except Exception:
+            rejections["json"] += 1
+            return None
+        
+        return payload, decrypted
+    
+    def _tag_key_for(self, crypto: CryptoEngine) -> bytes:
+        """Tag key for an engine, derived on first use."""
+        tag_key = self._tag_keys.get(crypto)
+        if tag_key is None:
+            tag_key = derive_tag_key(crypto.get_key_string())
+            self._tag_keys[crypto] = tag_key
+        return tag_key
+    
+    def _record_rejections(self, rejections: Counter):
+        """Add one detection's rejection counts to the cumulative stats."""
+        with self._stats_lock:
+            self.rejection_stats.update(rejections)
+    
+    def _read_framed_payload(
+        self,
+        plane: _LumaPlane,
+        max_bits: int,
+        rejections: Counter
+    ) -> Tuple[Optional[FrameHeader], Optional[_Candidate]]:
+        """
+        Read the format header from the leading locations and extract the body it declares.
+        
+        Returns:
+            (header, candidate). header is None if the image has no readable
+            header (legacy stream or no watermark); candidate is None if
+            there is no header, the declared body does not fit the image or
+            the header does not read back the same from the full-length
+            locations
+        """
+        from ..core.embedder import WatermarkEmbedder
+        
+        height, width = plane.channel.shape[:2]
+        header_bits = HEADER_SIZE * 8
+        if header_bits > max_bits:
+            return None, None
+        
+        parsed: Optional[FrameHeader] = None
+        try:
+            header_locations = WatermarkEmbedder._select_embedding_locations(
+                height, width, header_bits, saliency_map=None, block_size=8
+            )
+            header = WatermarkExtractor._bits_to_bytes(
+                self._extract_bits_from_dct(plane, header_locations[:header_bits])
+            )
+            parsed = parse_header(header)
+            if parsed is None:
+                rejections["header"] += 1
+                return None, None
+            
+            embedded_size = parsed.size + parsed.body_length
+            bits_needed = embedded_size * 8
+            if bits_needed > max_bits:
+                rejections["header"] += 1
+                return parsed, None
+            
+            # Single extraction of the declared size
+            embedding_locations = WatermarkEmbedder._select_embedding_locations(
+                height, width, bits_needed, saliency_map=None, block_size=8
+            )
+            stream = WatermarkExtractor._bits_to_bytes(
+                self._extract_bits_from_dct(plane, embedding_locations[:bits_needed])
+            )
+        except Exception:
+            rejections["header"] += 1
+            return parsed, None
+        
+        # The embedder chose locations for the whole stream, so re-read the
+        # header from those rather than relying on location selection being
+        # prefix-stable; a header that does not repeat there is not trusted
+        confirmed = parse_header(stream)
+        if (
+            confirmed is None
+            or confirmed.version != parsed.version
+            or confirmed.body_length != parsed.body_length
+        ):
+            rejections["header"] += 1
+            return parsed, None
+        
+        return confirmed, _Candidate(embedded_size, stream[confirmed.size:], confirmed.version, confirmed)
+    
+    def _evaluate_serial(
+        self,
+        engines: List[Tuple[Optional[str], CryptoEngine]],
+        jobs: Iterator[Callable[[], Optional[_Candidate]]],
+        rejections: Counter
+    ) -> Optional[Tuple[_Candidate, Tuple[Optional[str], Dict[str, Any], bytes]]]:
+        """Evaluate candidates in order and return the first that decodes."""
+        for job in jobs:
+            candidate = job()
+            if candidate is None:
+                continue
+            decoded = self._decode_candidate(engines, candidate, rejections)
+            if decoded is not None:
+                return candidate, decoded
+        return None
+    
+    def _evaluate_parallel(
+        self,
+        engines: List[Tuple[Optional[str], CryptoEngine]],
+        jobs: Iterator[Callable[[], Optional[_Candidate]]],
+        rejections: Counter
+    ) -> Optional[Tuple[_Candidate, Tuple[Optional[str], Dict[str, Any], bytes]]]:
+        """
+        Evaluate candidates on the detector's thread pool.
+        
+        At most 2 x parallelism candidates are in flight. Returns as soon as
+        one decodes; queued candidates are cancelled and running ones stop
+        before their decode stage.
+        """
+        executor = self._get_executor()
+        found = threading.Event()
+        
+        def run(job):
+            local: Counter = Counter()
+            if found.is_set():
+                return None, None, local
+            candidate = job()
+            if candidate is None or found.is_set():
+                return candidate, None, local
+            decoded = self._decode_candidate(engines, candidate, local)
+            if decoded is not None:
+                found.set()
+            return candidate, decoded, local
+        
+        pending = set()
+        try:
+            while True:
+                while len(pending) < 2 * self.parallelism:
+                    job = next(jobs, None)
+                    if job is None:
+                        break
+                    pending.add(executor.submit(run, job))
+                
+                if not pending:
+                    return None
+                
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    candidate, decoded, local = future.result()
+                    rejections.update(local)
+                    if decoded is not None:
+                        return candidate, decoded
+        finally:
+            found.set()
+            for future in pending:
+                future.cancel()
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Thread pool for parallel candidate evaluation, created on first use."""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.parallelism,
+                    thread_name_prefix="truthmark-detect"
+                )
+            return self._executor
+    
+    def close(self):
+        """Shut down the candidate evaluation thread pool, if one was started."""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True, cancel_futures=True)
+                self._executor = None
+    
+    def _size_hypotheses(
+        self,
+        plane: _LumaPlane,
+        sizes: List[int]
+    ) -> Iterator[Callable[[], Optional[_Candidate]]]:
+        """
+        Yield a job per legacy (unframed, format version 0) size; calling the
+        job returns the extracted candidate, or None if extraction failed.
+        
+        Uses the same deterministic location algorithm as the embedder. In
+        incremental mode the location sequence and bit stream are computed
+        once for the largest size; a smaller size's locations are a prefix of
+        a larger size's, so each hypothesis is just a byte-aligned slice.
+        """
+        from ..core.embedder import WatermarkEmbedder
+        
+        if not sizes:
+            return
+        
+        height, width = plane.channel.shape[:2]
+        
+        if self.incremental_search:
+            bits_needed = sizes[-1] * 8
+            try:
+                embedding_locations = WatermarkEmbedder._select_embedding_locations(
+                    height, width, bits_needed, saliency_map=None, block_size=8
+                )
+                extracted_bits = self._extract_bits_from_dct(plane, embedding_locations[:bits_needed])
+                stream = WatermarkExtractor._bits_to_bytes(extracted_bits)
+            except Exception:
+                return
+            
+            for embedded_size_bytes in sizes:
+                yield lambda candidate=_Candidate(embedded_size_bytes, stream[:embedded_size_bytes]): candidate
+            return
+        
+        for embedded_size_bytes in sizes:
+            yield functools.partial(self._extract_candidate, plane, embedded_size_bytes)
+    
+    def _extract_candidate(self, plane: _LumaPlane, embedded_size_bytes: int) -> Optional[_Candidate]:
+        """Select locations and extract bytes for one legacy size hypothesis."""
+        from ..core.embedder import WatermarkEmbedder
+        
+        height, width = plane.channel.shape[:2]
+        bits_needed = embedded_size_bytes * 8
+        try:
+            # Recompute embedding locations using same algorithm
+            embedding_locations = WatermarkEmbedder._select_embedding_locations(
+                height, width, bits_needed, saliency_map=None, block_size=8
+            )
+            
+            # Extract raw bits (without ECC or decryption)
+            extracted_bits = self._extract_bits_from_dct(plane, embedding_locations[:bits_needed])
+            
+            # Convert bits to bytes
+            extracted_data = WatermarkExtractor._bits_to_bytes(extracted_bits)
+        except Exception:
+            # Extraction failed, try next size
+            return None
+        
+        return _Candidate(embedded_size_bytes, extracted_data)
+    
     def _build_result(
         self,
         payload: Dict[str, Any],
@@ -452,19 +907,32 @@ class TruthMarkDetector:
     def detect_batch(
         self,
         image_paths: List[Union[str, Path]],
-        keys: Optional[Union[str, List[str]]] = None
+        keys: Optional[Union[str, KeyRing, List[str]]] = None,
+        workers: int = 1,
+        ordered: bool = True,
+        chunksize: int = 16,
+        max_pending: Optional[int] = None
     ) -> List[DetectResult]:
         """
         Batch detect watermarks in multiple images.
         
         Args:
             image_paths: List of image paths
-            keys: Single key for all, list of keys, or None
+            keys: Single key or KeyRing for all, list of keys, or None
+            workers: Number of worker processes. 1 = detect serially in this
+                process. Each worker builds its detector and crypto engines once
+            ordered: Return results in input order. False = completion order
+            chunksize: Images per task sent to a worker
+            max_pending: Chunks in flight or awaiting in-order delivery at
+                once (default 2 x workers); bounds memory for large batches
             
         Returns:
             List of DetectResult for each image
         """
-        results = []
+        # A keyring applies to the whole batch and is built once per worker
+        keyring = keys if isinstance(keys, KeyRing) else None
+        if keyring is not None:
+            keys = None
         
         # Handle single key for all images
         keys_list: List[Optional[str]] = []
@@ -475,11 +943,140 @@ class TruthMarkDetector:
         else:
             keys_list = [k for k in keys]  # Convert List[str] to List[Optional[str]]
         
-        for img_path, key in zip(image_paths, keys_list):
-            result = self.detect(img_path, key)
-            results.append(result)
+        items = zip(image_paths, keys_list)
         
-        return results
+        # Workers pre-build engines for a shared set of keys, not per-image ones
+        distinct_keys = sorted({k for k in keys_list if k and k != self.key})
+        if len(distinct_keys) > self.MAX_PREPARED_KEYS:
+            distinct_keys = []
+        
+        return [
+            result for _, _, result in self._iter_batch(
+                items, workers, ordered, chunksize, max_pending, distinct_keys, keyring
+            )
+        ]
+    
+    def iter_detect(
+        self,
+        paths: Union[str, Path, Iterable[Union[str, Path]]],
+        keys: Optional[Union[str, KeyRing, Iterable[Optional[str]]]] = None,
+        workers: int = 1,
+        ordered: bool = False,
+        chunksize: int = 16,
+        max_pending: Optional[int] = None,
+        recursive: bool = True
+    ) -> Iterator[Tuple[Union[str, Path], DetectResult]]:
+        """
+        Lazily detect watermarks over an arbitrarily large set of images.
+        
+        Paths are pulled from the iterator only as workers have room for
+        them and each (path, result) is yielded as soon as it is ready, so
+        memory stays bounded however big the corpus is.
+        
+        Args:
+            paths: Iterable of image paths (e.g. a generator), or a directory
+                to walk with os.scandir
+            keys: Single key or KeyRing for all, iterable of keys aligned with
+                paths, or None
+            workers: Number of worker processes. 1 = detect in this process
+            ordered: Yield in input order. False = as each image finishes
+            chunksize: Images per task sent to a worker
+            max_pending: Chunks in flight or buffered at once (default 2 x workers)
+            recursive: Descend into subdirectories when paths is a directory
+            
+        Yields:
+            (path, DetectResult) for each image
+            
+        Example:
+            >>> detector = TruthMarkDetector(key)
+            >>> for path, result in detector.iter_detect("/archive", workers=8):
+            >>>     if result.detected:
+            >>>         report.write(f"{path}\t{result.truthmark_id}\n")
+        """
+        if isinstance(paths, (str, Path)):
+            paths = iter_image_paths(paths, recursive=recursive)
+        
+        keyring = keys if isinstance(keys, KeyRing) else None
+        prepared_keys: List[str] = []
+        if isinstance(keys, (str, KeyRing)) or keys is None:
+            if isinstance(keys, str) and keys != self.key:
+                prepared_keys = [keys]
+            keys = itertools.repeat(keys if keyring is None else None)
+        
+        for _, path, result in self._iter_batch(
+            zip(paths, keys), workers, ordered, chunksize, max_pending, prepared_keys, keyring
+        ):
+            yield path, result
+    
+    def _iter_batch(
+        self,
+        items: Iterator[Tuple[Union[str, Path], Optional[str]]],
+        workers: int,
+        ordered: bool,
+        chunksize: int,
+        max_pending: Optional[int],
+        prepared_keys: Optional[List[str]] = None,
+        keyring: Optional[KeyRing] = None
+    ) -> Iterator[Tuple[int, Union[str, Path], DetectResult]]:
+        """
+        Batch detection engine: yield (index, path, result) for (path, key) items.
+        
+        Items are consumed lazily in chunks. With workers > 1 the chunks run on
+        a process pool whose workers are initialized once with this
+        detector's settings; no more than max_pending chunks are submitted or
+        held for in-order delivery at any time. keyring, if given, replaces
+        the detector's keyring for items without a key.
+        """
+        if workers <= 1:
+            for index, (path, key) in enumerate(items):
+                yield index, path, self.detect(path, key or keyring)
+            return
+        
+        max_pending = max_pending or 2 * workers
+        chunks = _chunked(enumerate(items), max(1, chunksize))
+        
+        options = {
+            "incremental_search": self.incremental_search,
+            "legacy_search": self.legacy_search,
+            "keyring": keyring or self.keyring,
+        }
+        
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_batch_worker,
+            initargs=(self.key, self.mode, self.config, options, prepared_keys or [])
+        ) as executor:
+            pending: Dict[Any, int] = {}
+            completed: Dict[int, List[Tuple[int, Union[str, Path], DetectResult]]] = {}
+            next_chunk = 0
+            submitted = 0
+            exhausted = False
+            
+            while True:
+                # Backpressure: in-flight plus buffered chunks stay bounded
+                while not exhausted and len(pending) + len(completed) < max_pending:
+                    chunk = next(chunks, None)
+                    if chunk is None:
+                        exhausted = True
+                        break
+                    pending[executor.submit(_detect_chunk, chunk)] = submitted
+                    submitted += 1
+                
+                if not pending and not completed:
+                    return
+                
+                if pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        chunk_index = pending.pop(future)
+                        if ordered:
+                            completed[chunk_index] = future.result()
+                        else:
+                            yield from future.result()
+                
+                while next_chunk in completed:
+                    yield from completed.pop(next_chunk)
+                    next_chunk += 1
     
     def check_ai_compliance(
         self,
@@ -525,39 +1122,100 @@ class TruthMarkDetector:
     
     def _extract_bits_from_dct(
         self,
-        channel: np.ndarray,
+        channel: Union[np.ndarray, "_LumaPlane"],
         locations: List[Tuple[int, int, int, int]]
     ) -> List[int]:
         """
         Extract bits from DCT coefficients.
         
         Args:
-            channel: Image channel (Y channel)
+            channel: Image channel (Y channel) or a _LumaPlane whose block
+                DCTs are reused across calls
             locations: List of embedding locations (block_y, block_x, coef_y, coef_x)
             
         Returns:
             List of extracted bits (0 or 1)
         """
-        BLOCK_SIZE = 8
-        bits = []
+        if not isinstance(channel, _LumaPlane):
+            channel = _LumaPlane(channel)
         
-        for block_y, block_x, coef_y, coef_x in locations:
-            # Extract DCT block
-            y_start = block_y * BLOCK_SIZE
-            x_start = block_x * BLOCK_SIZE
-            block = channel[y_start:y_start + BLOCK_SIZE,
-                           x_start:x_start + BLOCK_SIZE]
-            
-            # Apply DCT
-            dct_block = cv2.dct(block)
-            
-            # Extract bit based on coefficient value
-            # Positive modification -> bit 1, negative -> bit 0
-            coefficient = dct_block[coef_y, coef_x]
-            bit = 1 if coefficient > 0 else 0
-            bits.append(bit)
+        if len(locations) == 0:
+            return []
         
-        return bits
+        # Positive modification -> bit 1, negative -> bit 0
+        coefficients = channel.coefficients(locations)
+        return (coefficients > 0).astype(np.uint8).tolist()
+
+
+# File extensions picked up when walking a directory
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".webp", ".bmp", ".tif", ".tiff")
+
+
+def iter_image_paths(
+    directory: Union[str, Path],
+    recursive: bool = True,
+    extensions: Tuple[str, ...] = IMAGE_EXTENSIONS
+) -> Iterator[str]:
+    """
+    Lazily walk a directory with os.scandir and yield image file paths.
+    
+    Args:
+        directory: Directory to walk
+        recursive: Descend into subdirectories
+        extensions: Lower-case file extensions to include
+        
+    Yields:
+        Path of each image file
+    """
+    stack = [os.fspath(directory)]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            stack.append(entry.path)
+                    elif entry.name.lower().endswith(extensions):
+                        yield entry.path
+        except OSError:
+            # Unreadable directory: skip it rather than abort the walk
+            continue
+
+
+def _chunked(iterable, size: int) -> Iterator[list]:
+    """Lazily split an iterable into lists of up to size items."""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+# Per-process detector used by batch workers
+_worker_detector: Optional[TruthMarkDetector] = None
+
+
+def _init_batch_worker(
+    key: Optional[str],
+    mode: str,
+    config: TruthMarkConfig,
+    options: Dict[str, Any],
+    prepared_keys: List[str]
+):
+    """Process pool initializer: build the detector and crypto engines once per worker."""
+    global _worker_detector
+    _worker_detector = TruthMarkDetector(key=key, mode=mode, config=config, **options)
+    _worker_detector.prepare_keys(prepared_keys)
+
+
+def _detect_chunk(chunk: List[Tuple[int, Tuple[Union[str, Path], Optional[str]]]]) -> List[Tuple[int, Union[str, Path], DetectResult]]:
+    """Detect one chunk of (index, (path, key)) items in a batch worker."""
+    return [
+        (index, path, _worker_detector.detect(path, key))
+        for index, (path, key) in chunk
+    ]
 
 
 # Convenience aliases
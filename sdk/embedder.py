@@ -3,11 +3,17 @@ TruthMark Embedder - Unified SDK
 Complete watermark embedding with ALL features in ONE place
 """
 
-import os
+import copy
+import hashlib
+import io
+import math
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import numpy as np
 from PIL import Image
 from pathlib import Path
-from typing import Union, Optional, Dict, Any, Tuple
+from typing import Union, Optional, Dict, Any, List, Tuple, Callable, NamedTuple
 from dataclasses import dataclass
 import json
 
@@ -16,6 +22,71 @@ from ..core.embedder import WatermarkEmbedder
 from ..core.payload import PayloadBuilder
 from ..core.config import TruthMarkConfig, get_config
 from ..ai.saliency_detector import SaliencyDetector
+from .framing import frame_payload
+from .cache import get_crypto_engine, get_error_correction
+from .image_loader import LoadedImage, load_image
+
+
+class FingerprintAlgorithm(NamedTuple):
+    """How an image_hash is computed."""
+    new_hash: Callable[[], Any]  # hashlib constructor
+    row_step: int = 1  # Hash every row_step-th pixel row; 1 = every pixel
+
+
+# image_hash algorithms by versioned name. "sha256" is the original
+# fingerprint; new names are added rather than changing an existing one, so
+# a recorded image_hash_alg always identifies how to recompute the hash.
+# "sha256-rows16-v1" hashes the array shape plus every 16th row: about 16x
+# less data, for when a fingerprint only has to identify the image rather
+# than cover every pixel (edits confined to skipped rows do not change it).
+FINGERPRINT_ALGORITHMS = {
+    "sha256": FingerprintAlgorithm(hashlib.sha256),
+    "sha256-rows16-v1": FingerprintAlgorithm(hashlib.sha256, row_step=16),
+}
+DEFAULT_FINGERPRINT_ALGORITHM = "sha256"
+
+# Rows hashed per update when the pixel array is not contiguous
+_FINGERPRINT_CHUNK_BYTES = 1 << 22
+
+
+def image_fingerprint(img_array: np.ndarray, algorithm: str = DEFAULT_FINGERPRINT_ALGORITHM) -> str:
+    """
+    16-hex-character fingerprint of an image's pixels.
+    
+    Hashes the array's bytes in C order without copying them: a contiguous
+    array is passed to the hash as a buffer, anything else is hashed in
+    row chunks of about 4MB. For "sha256" the result equals hashing
+    img_array.tobytes(). Sampled algorithms hash the shape (as little-endian
+    uint64s) followed by rows 0, row_step, 2 * row_step, ...
+    
+    Args:
+        img_array: Pixel array
+        algorithm: Name from FINGERPRINT_ALGORITHMS
+    
+    Returns:
+        Fingerprint hex string
+    """
+    new_hash, row_step = FINGERPRINT_ALGORITHMS[algorithm]
+    digest = new_hash()
+    
+    if row_step > 1:
+        digest.update(np.asarray(img_array.shape, dtype="<u8").tobytes())
+        img_array = img_array[::row_step]
+    
+    if img_array.flags.c_contiguous:
+        # Buffer protocol: the hash reads the array's memory in place
+        digest.update(memoryview(img_array))
+    elif row_step > 1 and img_array.ndim > 1 and img_array[0:1].flags.c_contiguous:
+        # Strided view of a contiguous image: each sampled row is contiguous
+        for row in img_array:
+            digest.update(memoryview(row))
+    else:
+        row_bytes = img_array.itemsize * (img_array[0].size if img_array.ndim > 1 else 1)
+        rows = max(1, _FINGERPRINT_CHUNK_BYTES // max(1, row_bytes))
+        for start in range(0, len(img_array), rows):
+            digest.update(np.ascontiguousarray(img_array[start:start + rows]))
+    
+    return digest.hexdigest()[:16]
 
 
 @dataclass
@@ -37,6 +108,21 @@ class EmbedResult:
     original_size: Optional[int] = None
     output_size: Optional[int] = None
     
+    def load_image(self) -> Optional[np.ndarray]:
+        """
+        Watermarked image as an RGB array.
+        
+        Returns the in-memory array when the result kept it, else decodes
+        output_path on each call (after output encoding, so lossy formats
+        differ slightly from the embedded array).
+        """
+        if self.image is not None:
+            return self.image
+        if self.output_path is None:
+            return None
+        with Image.open(self.output_path) as img:
+            return np.array(img.convert('RGB'))
+    
     def __str__(self) -> str:
         if self.success:
             psnr = self.embedding_info.get('psnr_db', 0) if self.embedding_info else 0
@@ -61,6 +147,21 @@ class EmbedResult:
             return f"✗ Embedding failed: {self.error_message}"
 
 
+@dataclass
+class _EmbedJob:
+    """One image moving through the decode -> watermark -> encode stages."""
+    input_path: Path
+    copyright_info: Union[str, Dict[str, Any]]
+    output_path: Optional[Union[str, Path]] = None
+    keep_image: bool = True
+    loaded: Optional[LoadedImage] = None
+    format_settings: Optional[Dict[str, Any]] = None
+    payload: Optional[Dict[str, Any]] = None
+    watermarked: Optional[np.ndarray] = None
+    embed_info: Optional[Dict[str, Any]] = None
+    result: Optional[EmbedResult] = None
+
+
 class TruthMarkEmbedder:
     """
     Unified TruthMark watermark embedder with ALL features.
@@ -94,6 +195,23 @@ class TruthMarkEmbedder:
         >>>     result = embedder.embed(image, copyright_info)
     """
     
+    # Adaptive strength stays within these multiples of config.strength
+    ADAPTIVE_STRENGTH_RANGE = (0.7, 1.3)
+    
+    # JPEG quality range searched when matching the original file size
+    JPEG_QUALITY_RANGE = (70, 95)
+    
+    # Prior d(ln size)/d(quality) for JPEG in that range, used until a
+    # resolution has its own fitted curve
+    DEFAULT_JPEG_LOG_SIZE_SLOPE = 0.05
+    
+    # Fitted slopes per (width, height, subsampling), shared by all embedders.
+    # Least recently used resolutions are evicted past MAX_JPEG_SIZE_CURVES,
+    # so arbitrary input sizes cannot grow it without bound
+    MAX_JPEG_SIZE_CURVES = 256
+    _jpeg_size_curves: "OrderedDict[Tuple[int, int, int], float]" = OrderedDict()
+    _jpeg_size_curves_lock = threading.Lock()
+    
     def __init__(
         self,
         key: Optional[str] = None,
@@ -102,6 +220,9 @@ class TruthMarkEmbedder:
         strength: Optional[float] = None,
         target_psnr: Optional[float] = None,
         use_ai_saliency: Optional[bool] = None,
+        size_search: str = "binary",
+        verify_strength: bool = False,
+        fingerprint_algorithm: str = "sha256",
     ):
         """
         Initialize TruthMark embedder.
@@ -109,12 +230,31 @@ class TruthMarkEmbedder:
         Args:
             key: Encryption key (base64). None = auto-generate
             config: TruthMarkConfig object. None = use balanced preset
+            size_search: JPEG size-matching strategy when preserve_size is on:
+                "binary" (bisection over JPEG_QUALITY_RANGE) or "predictive"
+                (model-guided; ~20% fewer encodes in
+                benchmarks/bench_jpeg_size_search.py)
+            verify_strength: With adaptive strength, re-embed once at the
+                solved strength to check and correct the predicted PSNR
+                (adaptive mode costs at most two embeds, three with this)
+            fingerprint_algorithm: image_hash algorithm with include_fingerprint,
+                see FINGERPRINT_ALGORITHMS. Non-default choices are recorded
+                in the payload as image_hash_alg
             
             # Deprecated parameters (use config instead):
             strength: Embedding strength (use config.strength)
             target_psnr: Target PSNR (use config.target_psnr)
             use_ai_saliency: Use AI (use config.use_ai_saliency)
         """
+        if size_search not in ("predictive", "binary"):
+            raise ValueError(f"Unknown size_search: {size_search}")
+        self.size_search = size_search
+        self.verify_strength = verify_strength
+        
+        if fingerprint_algorithm not in FINGERPRINT_ALGORITHMS:
+            raise ValueError(f"Unknown fingerprint_algorithm: {fingerprint_algorithm}")
+        self.fingerprint_algorithm = fingerprint_algorithm
+        
         # Use provided config or create default
         if config is None:
             config = get_config("balanced")
@@ -140,10 +280,10 @@ class TruthMarkEmbedder:
         
         # Initialize crypto engine
         if key:
-            self.crypto = CryptoEngine(key)
+            self.crypto = get_crypto_engine(key)
             self.key = key
         elif config.encryption_key:
-            self.crypto = CryptoEngine(config.encryption_key)
+            self.crypto = get_crypto_engine(config.encryption_key)
             self.key = config.encryption_key
         else:
             self.crypto = CryptoEngine()
@@ -170,6 +310,7 @@ class TruthMarkEmbedder:
         input_path: Union[str, Path],
         copyright_info: Union[str, Dict[str, Any]],
         output_path: Optional[Union[str, Path]] = None,
+        keep_image: bool = True,
         **kwargs
     ) -> EmbedResult:
         """
@@ -179,160 +320,199 @@ class TruthMarkEmbedder:
             input_path: Path to input image
             copyright_info: Copyright information (string or dict)
             output_path: Path for output. None = auto-generate
+            keep_image: Keep the watermarked array in EmbedResult.image.
+                False = only the output file is kept; use
+                EmbedResult.load_image() to decode it when needed
             **kwargs: Override config settings for this embed
         
         Returns:
             EmbedResult with all information
         """
+        job = _EmbedJob(
+            input_path=Path(input_path),
+            copyright_info=copyright_info,
+            output_path=output_path,
+            keep_image=keep_image
+        )
+        for stage in (self._decode_stage, self._watermark_stage, self._encode_stage):
+            self._run_stage(stage, job)
+        return job.result
+    
+    def _run_stage(self, stage, job: "_EmbedJob"):
+        """Run one embed stage on a job; a failure becomes the job's result."""
+        if job.result is not None:
+            return
         try:
-            input_path = Path(input_path)
-            
-            # Load original image
-            original_img = Image.open(input_path)
-            original_format = original_img.format
-            original_size = os.path.getsize(input_path)
-            
-            # Get format-specific settings if preserving
-            format_settings = None
-            if self.config.preserve_format:
-                format_settings = self._detect_format_settings(input_path, original_img)
-            
-            # Convert to RGB array
-            img_array = np.array(original_img.convert('RGB'))
-            
-            # Build payload
-            payload_builder = PayloadBuilder()
-            
-            payload_dict: Dict[str, Any]
-            if isinstance(copyright_info, dict):
-                payload_dict = copyright_info.copy()
-            else:
-                payload_dict = {"copyright": copyright_info}
-            
-            # Add optional metadata based on config
-            if self.config.include_timestamp:
-                from datetime import datetime
-                payload_dict["timestamp"] = datetime.now().isoformat()
-            
-            if self.config.include_truthmark_id:
-                import uuid
-                payload_dict["truthmark_id"] = str(uuid.uuid4())
-            
-            if self.config.include_fingerprint:
-                import hashlib
-                payload_dict["image_hash"] = hashlib.sha256(img_array.tobytes()).hexdigest()[:16]
-            
-            # Add EU AI Act compliance if needed
-            if self.config.ai_act_compliance:
-                payload_dict.setdefault("ai_compliance", {})
-                payload_dict["ai_compliance"]["eu_ai_act"] = True
-                payload_dict["ai_compliance"]["synthetic_content"] = payload_dict.get("ai_generated", False)
-            
-            # Add custom metadata
-            if self.config.custom_metadata:
-                payload_dict.update(self.config.custom_metadata)
-            
-            # Create payload bytes
-            payload_json = json.dumps(payload_dict, separators=(',', ':'))
-            payload_bytes = payload_json.encode('utf-8')
-            
-            # Apply error correction if enabled
-            if self.config.use_error_correction:
-                from ..core.error_correction import ErrorCorrection
-                ecc = ErrorCorrection(ecc_symbols=self.config.get_ecc_symbols())
-                payload_bytes = ecc.encode(payload_bytes)
-            
-            # Encrypt payload
-            encrypted_data, integrity_hash = self.crypto.encrypt(payload_bytes)
-            # Combine encrypted data and hash for embedding
-            encrypted_payload = encrypted_data + integrity_hash
-            
-            # Compute saliency map if AI enabled
-            saliency_map = None
-            if self.saliency_detector:
-                saliency_map = self.saliency_detector.detect(img_array)
-            
-            # Adaptive strength to meet target PSNR
-            current_strength = self.config.strength
-            if self.config.adaptive_strength:
-                current_strength = self._find_optimal_strength(
-                    img_array,
-                    encrypted_payload,
-                    saliency_map,
-                    self.config.target_psnr
-                )
-            
-            # Embed watermark
-            watermarked_array, embed_info = self.embedder.embed(
-                image=img_array,
-                payload=encrypted_payload,
-                saliency_map=saliency_map
-            )
-            
-            # Convert back to PIL Image
-            watermarked_img = Image.fromarray(watermarked_array.astype(np.uint8))
-            
-            # Generate output path if not provided
-            if output_path is None:
-                output_path = input_path.parent / f"{input_path.stem}_watermarked{input_path.suffix}"
-            else:
-                output_path = Path(output_path)
-            
-            # Save with format preservation
-            format_preserved = False
-            size_match = 0.0
-            
-            if self.config.preserve_format and format_settings and original_format:
-                self._save_with_format_preservation(
-                    watermarked_img,
-                    output_path,
-                    original_format,
-                    format_settings,
-                    original_size if self.config.preserve_size else None
-                )
-                format_preserved = True
-            else:
-                # Simple save
-                watermarked_img.save(str(output_path))
-            
-            # Calculate size match
-            output_size = os.path.getsize(output_path)
-            size_match = output_size / original_size if original_size > 0 else 0.0
-            
-            # Return result
-            return EmbedResult(
-                success=True,
-                key=self.key,
-                output_path=str(output_path),
-                payload=payload_dict,
-                embedding_info=embed_info,
-                image=watermarked_array,
-                format_preserved=format_preserved,
-                size_match=size_match,
-                original_format=original_format,
-                output_format=Image.open(output_path).format,
-                original_size=original_size,
-                output_size=output_size
-            )
-            
+            stage(job)
         except Exception as e:
-            return EmbedResult(
+            job.result = EmbedResult(
                 success=False,
                 key=self.key,
                 error_message=str(e)
             )
     
-    def _detect_format_settings(self, path: Path, img: Image.Image) -> Dict[str, Any]:
+    def _decode_stage(self, job: "_EmbedJob"):
+        """Stage 1 (I/O): read and decode the input, detect format settings."""
+        # Load original image (one read, one decode)
+        job.loaded = load_image(job.input_path)
+        
+        # Get format-specific settings if preserving
+        if self.config.preserve_format:
+            job.format_settings = self._detect_format_settings(job.loaded)
+    
+    def _watermark_stage(self, job: "_EmbedJob"):
+        """Stage 2 (CPU): build and encrypt the payload, saliency, embed."""
+        copyright_info = job.copyright_info
+        img_array = job.loaded.pixels
+        
+        # Build payload
+        payload_builder = PayloadBuilder()
+        
+        payload_dict: Dict[str, Any]
+        if isinstance(copyright_info, dict):
+            payload_dict = copyright_info.copy()
+        else:
+            payload_dict = {"copyright": copyright_info}
+        
+        # Add optional metadata based on config
+        if self.config.include_timestamp:
+            from datetime import datetime
+            payload_dict["timestamp"] = datetime.now().isoformat()
+        
+        if self.config.include_truthmark_id:
+            import uuid
+            payload_dict["truthmark_id"] = str(uuid.uuid4())
+        
+        if self.config.include_fingerprint:
+            payload_dict["image_hash"] = image_fingerprint(img_array, self.fingerprint_algorithm)
+            if self.fingerprint_algorithm != DEFAULT_FINGERPRINT_ALGORITHM:
+                payload_dict["image_hash_alg"] = self.fingerprint_algorithm
+        
+        # Add EU AI Act compliance if needed
+        if self.config.ai_act_compliance:
+            payload_dict.setdefault("ai_compliance", {})
+            payload_dict["ai_compliance"]["eu_ai_act"] = True
+            payload_dict["ai_compliance"]["synthetic_content"] = payload_dict.get("ai_generated", False)
+        
+        # Add custom metadata
+        if self.config.custom_metadata:
+            payload_dict.update(self.config.custom_metadata)
+        
+        # Create payload bytes
+        payload_json = json.dumps(payload_dict, separators=(',', ':'))
+        payload_bytes = payload_json.encode('utf-8')
+        
+        # Apply error correction if enabled
+        if self.config.use_error_correction:
+            ecc = get_error_correction(self.config.get_ecc_symbols())
+            payload_bytes = ecc.encode(payload_bytes)
+        
+        # Encrypt payload
+        encrypted_data, integrity_hash = self.crypto.encrypt(payload_bytes)
+        # Combine encrypted data and hash, behind the self-describing
+        # length header the detector reads first. The tag is keyed with the
+        # engine's key string, as the detector verifies it
+        encrypted_payload = frame_payload(encrypted_data + integrity_hash, key=self.crypto.get_key_string())
+        
+        # Compute saliency map if AI enabled
+        saliency_map = None
+        if self.saliency_detector:
+            saliency_map = self.saliency_detector.detect(img_array)
+        
+        # Adaptive strength to meet target PSNR
+        current_strength = self.config.strength
+        watermarked_array, embed_info = None, None
+        if self.config.adaptive_strength:
+            current_strength, watermarked_array, embed_info = self._find_optimal_strength(
+                img_array,
+                encrypted_payload,
+                saliency_map,
+                self.config.target_psnr
+            )
+        
+        # Embed watermark, unless the strength search already embedded
+        # at the chosen strength
+        if watermarked_array is None:
+            watermarked_array, embed_info = self._embedder_for_strength(current_strength).embed(
+                image=img_array,
+                payload=encrypted_payload,
+                saliency_map=saliency_map
+            )
+        embed_info["strength"] = current_strength
+        
+        job.payload = payload_dict
+        job.watermarked = watermarked_array
+        job.embed_info = embed_info
+    
+    def _encode_stage(self, job: "_EmbedJob"):
+        """Stage 3 (I/O): encode with format preservation and write the output."""
+        input_path = job.input_path
+        output_path = job.output_path
+        original_format = job.loaded.format
+        original_size = job.loaded.file_size
+        format_settings = job.format_settings
+        
+        # Convert back to PIL Image
+        watermarked_img = Image.fromarray(job.watermarked.astype(np.uint8))
+        
+        # Generate output path if not provided
+        if output_path is None:
+            output_path = input_path.parent / f"{input_path.stem}_watermarked{input_path.suffix}"
+        else:
+            output_path = Path(output_path)
+        
+        # Encode with format preservation
+        format_preserved = False
+        size_match = 0.0
+        
+        if self.config.preserve_format and format_settings and original_format:
+            encoded = self._encode_with_format_preservation(
+                watermarked_img,
+                original_format,
+                format_settings,
+                original_size if self.config.preserve_size else None
+            )
+            output_format = original_format
+            format_preserved = True
+        else:
+            # Simple save, format chosen by the output extension
+            output_format = Image.registered_extensions().get(output_path.suffix.lower(), original_format)
+            encoded = io.BytesIO()
+            watermarked_img.save(encoded, format=output_format)
+        
+        # Output format and size come from the encoder, not a re-read
+        with open(output_path, "wb") as f:
+            f.write(encoded.getbuffer())
+        output_size = encoded.getbuffer().nbytes
+        size_match = output_size / original_size if original_size > 0 else 0.0
+        
+        # Return result
+        job.result = EmbedResult(
+            success=True,
+            key=self.key,
+            output_path=str(output_path),
+            payload=job.payload,
+            embedding_info=job.embed_info,
+            image=job.watermarked if job.keep_image else None,
+            format_preserved=format_preserved,
+            size_match=size_match,
+            original_format=original_format,
+            output_format=output_format,
+            original_size=original_size,
+            output_size=output_size
+        )
+    
+    def _detect_format_settings(self, loaded: LoadedImage) -> Dict[str, Any]:
         """Detect original format-specific settings."""
         settings = {}
         
-        if img.format == "JPEG":
+        if loaded.format == "JPEG":
             # Try to detect JPEG quality
             if self.config.jpeg_quality is not None:
                 settings["quality"] = self.config.jpeg_quality
             else:
                 # Estimate quality from file
-                settings["quality"] = self._estimate_jpeg_quality(path)
+                settings["quality"] = self._estimate_jpeg_quality(loaded)
             
             # Detect subsampling
             if self.config.jpeg_subsampling:
@@ -340,13 +520,13 @@ class TruthMarkEmbedder:
             else:
                 settings["subsampling"] = 0  # 4:4:4 (best quality)
         
-        elif img.format == "PNG":
+        elif loaded.format == "PNG":
             if self.config.png_compression is not None:
                 settings["compress_level"] = self.config.png_compression
             else:
                 settings["compress_level"] = 6  # Default
         
-        elif img.format == "WEBP":
+        elif loaded.format == "WEBP":
             if self.config.webp_quality is not None:
                 settings["quality"] = self.config.webp_quality
             else:
@@ -354,22 +534,16 @@ class TruthMarkEmbedder:
         
         # Preserve metadata
         if self.config.preserve_metadata:
-            if hasattr(img, 'info'):
-                settings["exif"] = img.info.get("exif")
-                settings["icc_profile"] = img.info.get("icc_profile")
+            settings["exif"] = loaded.exif
+            settings["icc_profile"] = loaded.icc_profile
         
         return settings
     
-    def _estimate_jpeg_quality(self, path: Path) -> int:
+    def _estimate_jpeg_quality(self, loaded: LoadedImage) -> int:
         """Estimate JPEG quality from file size."""
         # Rough estimation based on file size ratio
-        img = Image.open(path)
-        width, height = img.size
-        pixels = width * height
-        file_size = os.path.getsize(path)
-        
         # bytes per pixel
-        bpp = file_size / pixels
+        bpp = loaded.file_size / loaded.pixel_count
         
         # Rough mapping (empirical)
         if bpp > 2.0:
@@ -383,31 +557,21 @@ class TruthMarkEmbedder:
         else:
             return 70
     
-    def _save_with_format_preservation(
+    def _encode_with_format_preservation(
         self,
         img: Image.Image,
-        output_path: Path,
         original_format: str,
         format_settings: Dict[str, Any],
         target_size: Optional[int] = None
-    ):
-        """Save image with format preservation and optional size matching."""
+    ) -> io.BytesIO:
+        """Encode image with format preservation and optional size matching."""
         
         if not self.config.preserve_size or target_size is None:
-            # Just save with detected settings
+            # Just encode with detected settings
+            encoded = io.BytesIO()
             if original_format == "JPEG":
-                # Build save kwargs, only include non-None values
-                save_kwargs = {
-                    "format": "JPEG",
-                    "quality": format_settings.get("quality", 85),
-                    "subsampling": format_settings.get("subsampling", 0)
-                }
-                if format_settings.get("exif") is not None:
-                    save_kwargs["exif"] = format_settings["exif"]
-                if format_settings.get("icc_profile") is not None:
-                    save_kwargs["icc_profile"] = format_settings["icc_profile"]
-                
-                img.save(str(output_path), **save_kwargs)
+                save_kwargs = self._jpeg_save_kwargs(format_settings, format_settings.get("quality", 85))
+                img.save(encoded, **save_kwargs)
             elif original_format == "PNG":
                 save_kwargs = {
                     "format": "PNG",
@@ -416,74 +580,88 @@ class TruthMarkEmbedder:
                 if format_settings.get("icc_profile") is not None:
                     save_kwargs["icc_profile"] = format_settings["icc_profile"]
                 
-                img.save(str(output_path), **save_kwargs)
+                img.save(encoded, **save_kwargs)
             else:
-                img.save(str(output_path), format=original_format)
-            return
+                img.save(encoded, format=original_format)
+            return encoded
         
-        # Binary search for quality to match size
+        # Search for quality to match size
         if original_format == "JPEG":
-            quality = self._binary_search_jpeg_quality(
+            if self.size_search == "predictive":
+                search = self._predictive_jpeg_quality
+            else:
+                search = self._binary_search_jpeg_quality
+            # The winning probe is the final encoding; no second encode
+            _, encoded = search(
                 img,
-                output_path,
                 target_size,
                 format_settings
             )
-            save_kwargs = {
-                "format": "JPEG",
-                "quality": quality,
-                "subsampling": format_settings.get("subsampling", 0)
-            }
-            if format_settings.get("exif") is not None:
-                save_kwargs["exif"] = format_settings["exif"]
-            if format_settings.get("icc_profile") is not None:
-                save_kwargs["icc_profile"] = format_settings["icc_profile"]
-            
-            img.save(str(output_path), **save_kwargs)
-        else:
-            # For PNG, just save (compression doesn't affect size much)
-            save_kwargs = {
-                "format": original_format,
-                "compress_level": format_settings.get("compress_level", 6)
-            }
-            if format_settings.get("icc_profile") is not None:
-                save_kwargs["icc_profile"] = format_settings["icc_profile"]
-            
-            img.save(str(output_path), **save_kwargs)
+            return encoded
+        
+        # For PNG, just encode (compression doesn't affect size much)
+        save_kwargs = {
+            "format": original_format,
+            "compress_level": format_settings.get("compress_level", 6)
+        }
+        if format_settings.get("icc_profile") is not None:
+            save_kwargs["icc_profile"] = format_settings["icc_profile"]
+        
+        encoded = io.BytesIO()
+        img.save(encoded, **save_kwargs)
+        return encoded
+    
+    def _jpeg_save_kwargs(self, format_settings: Dict[str, Any], quality: int) -> Dict[str, Any]:
+        """JPEG save kwargs for a quality, only including non-None metadata."""
+        save_kwargs = {
+            "format": "JPEG",
+            "quality": quality,
+            "subsampling": format_settings.get("subsampling", 0)
+        }
+        if format_settings.get("exif") is not None:
+            save_kwargs["exif"] = format_settings["exif"]
+        if format_settings.get("icc_profile") is not None:
+            save_kwargs["icc_profile"] = format_settings["icc_profile"]
+        return save_kwargs
     
     def _binary_search_jpeg_quality(
         self,
         img: Image.Image,
-        output_path: Path,
         target_size: int,
         format_settings: Dict[str, Any],
         max_iterations: int = 10
-    ) -> int:
-        """Binary search to find JPEG quality that matches target size."""
+    ) -> Tuple[int, io.BytesIO]:
+        """
+        Binary search to find JPEG quality that matches target size.
+        
+        Probes are encoded into two reusable in-memory buffers (with the final
+        metadata, so their size is the real output size). Returns the chosen
+        quality and the buffer holding its encoding, ready to be written out.
+        """
         
         tolerance = target_size * self.config.size_tolerance
         low_quality = 70
         high_quality = 95
         best_quality = 85
         
+        probe = io.BytesIO()
+        best: Optional[io.BytesIO] = None
+        
         for _ in range(max_iterations):
-            mid_quality = (low_quality + high_quality) // 2
+            if low_quality > high_quality:
+                break
             
-            # Try saving with this quality
-            temp_path = output_path.with_suffix(".temp.jpg")
-            img.save(
-                str(temp_path),
-                format="JPEG",
-                quality=mid_quality,
-                subsampling=format_settings.get("subsampling", 0)
-            )
+            mid_quality = (low_quality + high_quality) // 2
             
-            current_size = os.path.getsize(temp_path)
-            temp_path.unlink()
+            # Try encoding with this quality
+            probe.seek(0)
+            probe.truncate()
+            img.save(probe, **self._jpeg_save_kwargs(format_settings, mid_quality))
+            current_size = probe.tell()
             
             # Check if within tolerance
             if abs(current_size - target_size) <= tolerance:
-                return mid_quality
+                return mid_quality, probe
             
             # Adjust search range
             if current_size > target_size:
@@ -491,8 +669,121 @@ class TruthMarkEmbedder:
             else:
                 low_quality = mid_quality + 1
                 best_quality = mid_quality
+                # Keep this encoding; reuse the previous best buffer for probing
+                probe, best = (best or io.BytesIO()), probe
         
-        return best_quality
+        if best is None:
+            # Nothing came in under the target: encode the default quality
+            best = io.BytesIO()
+            img.save(best, **self._jpeg_save_kwargs(format_settings, best_quality))
+        
+        return best_quality, best
+    
+    def _predictive_jpeg_quality(
+        self,
+        img: Image.Image,
+        target_size: int,
+        format_settings: Dict[str, Any],
+        max_iterations: int = 10
+    ) -> Tuple[int, io.BytesIO]:
+        """
+        Model-guided search for the JPEG quality that matches target size.
+        
+        ln(size) is modelled as locally linear in quality. The first probe is
+        the source quality; the next quality is predicted from the slope fitted
+        to the probes so far (or the cached curve for this resolution) and
+        clamped inside the bracket of qualities already known to be too small
+        or too large. About 3 encodes per image against about 3.7 for the
+        binary search when seeded with the estimated source quality.
+        
+        Returns the chosen quality and the buffer holding its encoding.
+        If no probe is within tolerance, the highest quality under the target
+        wins, else the smallest encoding.
+        """
+        tolerance = target_size * self.config.size_tolerance
+        low_quality, high_quality = self.JPEG_QUALITY_RANGE
+        log_target = math.log(target_size)
+        
+        curve_key = (img.width, img.height, format_settings.get("subsampling", 0))
+        with self._jpeg_size_curves_lock:
+            slope = self._jpeg_size_curves.get(curve_key, self.DEFAULT_JPEG_LOG_SIZE_SLOPE)
+            if curve_key in self._jpeg_size_curves:
+                self._jpeg_size_curves.move_to_end(curve_key)
+        
+        probes: Dict[int, int] = {}  # quality -> encoded size
+        under: Optional[Tuple[int, io.BytesIO]] = None  # highest quality below target
+        over: Optional[Tuple[int, io.BytesIO]] = None  # lowest quality above target
+        probe = io.BytesIO()
+        
+        quality = min(max(int(format_settings.get("quality", 85)), low_quality), high_quality)
+        
+        for _ in range(max_iterations):
+            probe.seek(0)
+            probe.truncate()
+            img.save(probe, **self._jpeg_save_kwargs(format_settings, quality))
+            size = probe.tell()
+            probes[quality] = size
+            
+            if abs(size - target_size) <= tolerance:
+                self._update_jpeg_size_curve(curve_key, probes)
+                return quality, probe
+            
+            # Keep the best encoding on each side of the target; reuse the
+            # one it replaces as the next probe buffer
+            spare = io.BytesIO()
+            if size < target_size:
+                if under is None or quality > under[0]:
+                    spare = under[1] if under else spare
+                    under = (quality, probe)
+                    probe = spare
+            elif over is None or quality < over[0]:
+                spare = over[1] if over else spare
+                over = (quality, probe)
+                probe = spare
+            
+            # Predict the next quality from the local fit
+            lo = under[0] + 1 if under else low_quality
+            hi = over[0] - 1 if over else high_quality
+            if lo > hi:
+                break
+            
+            nearest = sorted(probes, key=lambda q: abs(math.log(probes[q]) - log_target))[:2]
+            if len(nearest) == 2 and nearest[0] != nearest[1]:
+                q1, q2 = nearest
+                fitted = (math.log(probes[q2]) - math.log(probes[q1])) / (q2 - q1)
+                if fitted > 0:
+                    slope = fitted
+            
+            predicted = nearest[0] + (log_target - math.log(probes[nearest[0]])) / slope
+            next_quality = min(max(int(round(predicted)), lo), hi)
+            if next_quality in probes:
+                # Step one notch towards the target instead of repeating a probe
+                next_quality += 1 if size < target_size else -1
+                if next_quality in probes or not lo <= next_quality <= hi:
+                    break
+            quality = next_quality
+        
+        self._update_jpeg_size_curve(curve_key, probes)
+        
+        # Nothing within tolerance: prefer the highest quality under the target
+        return under if under is not None else over
+    
+    def _update_jpeg_size_curve(self, curve_key: Tuple[int, int, int], probes: Dict[int, int]):
+        """Refine the cached ln(size)/quality slope for a resolution from search probes."""
+        if len(probes) < 2:
+            return
+        q_low, q_high = min(probes), max(probes)
+        observed = (math.log(probes[q_high]) - math.log(probes[q_low])) / (q_high - q_low)
+        if observed <= 0:
+            return
+        with self._jpeg_size_curves_lock:
+            previous = self._jpeg_size_curves.get(curve_key)
+            self._jpeg_size_curves[curve_key] = (
+                observed if previous is None else 0.5 * (previous + observed)
+            )
+            self._jpeg_size_curves.move_to_end(curve_key)
+            while len(self._jpeg_size_curves) > self.MAX_JPEG_SIZE_CURVES:
+                self._jpeg_size_curves.popitem(last=False)
     
     def _find_optimal_strength(
         self,
@@ -501,56 +792,97 @@ class TruthMarkEmbedder:
         saliency_map: Optional[np.ndarray],
         target_psnr: float,
         tolerance: float = 0.5
-    ) -> float:
-        """Find optimal strength to achieve target PSNR."""
-        
-        # Start with config strength
-        strengths_to_try = [
-            self.config.strength * 0.7,
-            self.config.strength * 0.85,
-            self.config.strength,
-            self.config.strength * 1.15,
-            self.config.strength * 1.3
-        ]
-        
-        best_strength = self.config.strength
-        best_psnr_diff = float('inf')
-        
-        for strength in strengths_to_try:
-            # Try embedding with this strength
-            test_embedder = WatermarkEmbedder(
-                crypto_engine=self.crypto,
-                strength=strength
+    ) -> Tuple[float, Optional[np.ndarray], Optional[Dict[str, Any]]]:
+        """
+        Find optimal strength to achieve target PSNR.
+        
+        The watermark perturbs each coefficient in proportion to strength, so
+        MSE scales with strength² and
+        
+            PSNR(s) = PSNR(s0) - 20 * log10(s / s0)
+        
+        One reference embed at the configured strength s0 measures PSNR(s0);
+        the strength for target_psnr then follows in closed form, clamped to
+        ADAPTIVE_STRENGTH_RANGE. Pixel rounding and clipping make the model
+        approximate, so with verify_strength enabled the solved strength is
+        embedded once more and corrected by the same formula if it misses.
+        
+        Cost: at most two embeds. When the reference embed already meets
+        target_psnr within tolerance (or the solved strength clamps back to
+        s0) it is reused as the output and adaptive mode costs one embed;
+        otherwise the caller embeds once more at the solved strength.
+        verify_strength adds one embed (at most three).
+        
+        Returns:
+            (strength, watermarked array, embed info). The array and info are
+            the trial embed at the returned strength, or None if no trial was
+            run at it and the caller still has to embed.
+        """
+        base_strength = self.config.strength
+        
+        try:
+            trial = self._embedder_for_strength(base_strength).embed(
+                image=img_array,
+                payload=payload,
+                saliency_map=saliency_map
             )
-            
+        except Exception:
+            return base_strength, None, None
+        trial_strength = base_strength
+        
+        strength = self._solve_strength(base_strength, trial[1].get('psnr_db', 0), target_psnr, tolerance)
+        
+        if self.verify_strength and strength != trial_strength:
             try:
-                _, embed_info = test_embedder.embed(
+                trial = self._embedder_for_strength(strength).embed(
                     image=img_array,
                     payload=payload,
                     saliency_map=saliency_map
                 )
-                
-                psnr = embed_info.get('psnr_db', 0)
-                psnr_diff = abs(psnr - target_psnr)
-                
-                if psnr_diff < best_psnr_diff:
-                    best_psnr_diff = psnr_diff
-                    best_strength = strength
-                
-                # If within tolerance, use it
-                if psnr_diff <= tolerance:
-                    return strength
-                    
+                trial_strength = strength
+                strength = self._solve_strength(strength, trial[1].get('psnr_db', 0), target_psnr, tolerance)
             except Exception:
-                continue
+                pass
+        
+        if strength == trial_strength:
+            return strength, trial[0], trial[1]
+        return strength, None, None
+    
+    def _solve_strength(
+        self,
+        strength: float,
+        psnr: float,
+        target_psnr: float,
+        tolerance: float
+    ) -> float:
+        """Closed-form strength for target_psnr given the PSNR measured at strength."""
+        if not np.isfinite(psnr) or psnr <= 0 or abs(psnr - target_psnr) <= tolerance:
+            return strength
         
-        return best_strength
+        solved = strength * 10 ** ((psnr - target_psnr) / 20)
+        
+        low, high = self.ADAPTIVE_STRENGTH_RANGE
+        return float(min(max(solved, self.config.strength * low), self.config.strength * high))
+    
+    def _embedder_for_strength(self, strength: float) -> WatermarkEmbedder:
+        """Core embedder for a strength, reusing the configured one when it matches."""
+        if strength == self.config.strength:
+            return self.embedder
+        return WatermarkEmbedder(
+            crypto_engine=self.crypto,
+            strength=strength,
+            use_error_correction=self.config.use_error_correction
+        )
     
     def embed_batch(
         self,
         image_paths: list[Union[str, Path]],
         copyright_infos: Union[Dict[str, Any], list[Dict[str, Any]]],
-        output_dir: Optional[Union[str, Path]] = None
+        output_dir: Optional[Union[str, Path]] = None,
+        workers: int = 1,
+        executor: str = "process",
+        chunksize: int = 4,
+        keep_images: bool = False
     ) -> list[EmbedResult]:
         """
         Batch embed watermarks into multiple images.
@@ -559,25 +891,123 @@ class TruthMarkEmbedder:
             image_paths: List of input image paths
             copyright_infos: Single dict for all, or list matching image_paths
             output_dir: Output directory. None = same as input
+            workers: Number of workers. 1 = embed serially in this embedder
+            executor: "process" (one core per worker), "thread" (lighter;
+                decode, DCT and encode release the GIL for much of their work)
+                or "pipeline" (staged decode/embed/encode threads, workers
+                = embed stage threads; see EmbedPipeline)
+            chunksize: Images per task sent to a process worker
+            keep_images: Keep each watermarked array in EmbedResult.image.
+                Off by default so batch memory does not grow with the batch;
+                results load from output_path via EmbedResult.load_image()
+            
+        Each worker builds its own embedder once, with this embedder's key
+        and settings, so every image in the batch is watermarked under the
+        same key. Workers share no mutable state: each gets a deep copy of
+        the config (the constructor adjusts it in place) and its own
+        CryptoEngine, WatermarkEmbedder and saliency detector rather than the
+        engine from the shared cache.
             
         Returns:
-            List of EmbedResult for each image
+            List of EmbedResult for each image, in input order
         """
-        results = []
+        if executor not in ("process", "thread", "pipeline"):
+            raise ValueError(f"Unknown executor: {executor}")
         
         # Handle single copyright info for all images
         if isinstance(copyright_infos, dict):
             copyright_infos = [copyright_infos] * len(image_paths)
         
-        for img_path, copyright_info in zip(image_paths, copyright_infos):
+        output_paths: List[Optional[Path]] = []
+        for img_path in image_paths:
             img_path = Path(img_path)
             
             if output_dir:
-                output_path = Path(output_dir) / f"{img_path.stem}_watermarked{img_path.suffix}"
+                output_paths.append(Path(output_dir) / f"{img_path.stem}_watermarked{img_path.suffix}")
             else:
-                output_path = None
-            
-            result = self.embed(img_path, copyright_info, output_path)
-            results.append(result)
+                output_paths.append(None)
+        
+        if workers <= 1:
+            return [
+                self.embed(img_path, copyright_info, output_path, keep_image=keep_images)
+                for img_path, copyright_info, output_path in zip(image_paths, copyright_infos, output_paths)
+            ]
         
-        return results
+        if executor == "pipeline":
+            from .pipeline import EmbedPipeline
+            return EmbedPipeline(self, embed_workers=workers).run(
+                image_paths, copyright_infos, output_dir, keep_images=keep_images
+            )
+        
+        if executor == "thread":
+            local = threading.local()
+            
+            def embed_one(img_path, copyright_info, output_path):
+                if not hasattr(local, "embedder"):
+                    local.embedder = self._worker_copy()
+                return local.embedder.embed(img_path, copyright_info, output_path, keep_image=keep_images)
+            
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                return list(pool.map(embed_one, image_paths, copyright_infos, output_paths))
+        
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_embed_worker,
+            initargs=(self.key, self.config, self._worker_options())
+        ) as pool:
+            return list(pool.map(
+                _embed_in_worker,
+                image_paths,
+                copyright_infos,
+                output_paths,
+                [keep_images] * len(output_paths),
+                chunksize=max(1, chunksize)
+            ))
+    
+    def _worker_options(self) -> Dict[str, Any]:
+        """Constructor options a batch worker needs to reproduce this embedder."""
+        return {
+            "size_search": self.size_search,
+            "verify_strength": self.verify_strength,
+            "fingerprint_algorithm": self.fingerprint_algorithm,
+        }
+    
+    def _worker_copy(self) -> "TruthMarkEmbedder":
+        """Independent embedder with this embedder's key and settings."""
+        return _build_worker_embedder(self.key, self.config, self._worker_options())
+    
+    def _use_private_crypto(self):
+        """Replace the cached (shared) crypto engine with one owned by this embedder."""
+        self.crypto = CryptoEngine(self.key)
+        self.embedder = WatermarkEmbedder(
+            crypto_engine=self.crypto,
+            strength=self.config.strength,
+            use_error_correction=self.config.use_error_correction
+        )
+
+
+# Per-process embedder for embed_batch workers, built once by the initializer
+_worker_embedder: Optional[TruthMarkEmbedder] = None
+
+
+def _build_worker_embedder(key: str, config: TruthMarkConfig, options: Dict[str, Any]) -> TruthMarkEmbedder:
+    """Embedder for one batch worker, owning its config copy and crypto engine."""
+    worker = TruthMarkEmbedder(key=key, config=copy.deepcopy(config), **options)
+    worker._use_private_crypto()
+    return worker
+
+
+def _init_embed_worker(key: str, config: TruthMarkConfig, options: Dict[str, Any]):
+    """Process pool initializer: build this worker's embedder."""
+    global _worker_embedder
+    _worker_embedder = _build_worker_embedder(key, config, options)
+
+
+def _embed_in_worker(
+    input_path: Union[str, Path],
+    copyright_info: Union[str, Dict[str, Any]],
+    output_path: Optional[Path],
+    keep_image: bool
+) -> EmbedResult:
+    """Embed one image with the worker's embedder."""
+    return _worker_embedder.embed(input_path, copyright_info, output_path, keep_image=keep_image)
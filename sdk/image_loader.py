@@ -0,0 +1,67 @@
+"""
+TruthMark Image Loader - Decode each input image exactly once
+
+Embedding needs the pixels, the container format, the encoded file size and
+the EXIF/ICC metadata to carry over. Reading those through separate
+Image.open/os.path.getsize calls costs a decode (or header parse) and a stat
+apiece. load_image reads the file into memory once and derives everything
+from that single read and decode.
+
+Example:
+    >>> loaded = load_image("photo.jpg")
+    >>> loaded.format, loaded.file_size, loaded.size
+    ('JPEG', 2483117, (4032, 3024))
+"""
+
+import io
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+import numpy as np
+from PIL import Image
+
+
+@dataclass
+class LoadedImage:
+    """Decoded image with the container information needed to re-encode it."""
+    pixels: np.ndarray  # RGB, uint8, (H, W, 3)
+    format: Optional[str]
+    file_size: int
+    size: Tuple[int, int]  # (width, height)
+    exif: Optional[bytes] = None
+    icc_profile: Optional[bytes] = None
+    info: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def pixel_count(self) -> int:
+        return self.size[0] * self.size[1]
+
+
+def load_image(path: Union[str, Path]) -> LoadedImage:
+    """
+    Read and decode an image file once.
+
+    Args:
+        path: Path to image
+
+    Returns:
+        LoadedImage with RGB pixels and container metadata
+    """
+    data = Path(path).read_bytes()
+
+    with Image.open(io.BytesIO(data)) as img:
+        image_format = img.format
+        info = dict(img.info)
+        size = img.size
+        pixels = np.array(img.convert('RGB'))
+
+    return LoadedImage(
+        pixels=pixels,
+        format=image_format,
+        file_size=len(data),
+        size=size,
+        exif=info.get("exif"),
+        icc_profile=info.get("icc_profile"),
+        info=info
+    )
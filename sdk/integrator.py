@@ -30,7 +30,10 @@ from PIL import Image
 from ..core.embedder import WatermarkEmbedder
 from ..core.crypto import CryptoEngine
 from ..core.payload import PayloadBuilder
+from ..core.config import TruthMarkConfig, get_config
 from ..ai.saliency_detector import SaliencyDetector
+from .framing import frame_payload
+from .cache import get_error_correction
 
 logger = logging.getLogger(__name__)
 
@@ -109,7 +112,8 @@ class TruthMarkIntegrator:
         strength: float = 15.0,
         saliency_method: str = "combined",
         enable_advanced_saliency: bool = False,
-        version: Optional[str] = None
+        version: Optional[str] = None,
+        config: Optional[TruthMarkConfig] = None
     ):
         """
         Initialize TruthMark Integrator
@@ -121,11 +125,14 @@ class TruthMarkIntegrator:
             saliency_method: Saliency detection method for smart embedding
             enable_advanced_saliency: Enable deep learning saliency
             version: AI tool version (e.g., "v2.1")
+            config: Payload settings shared with the detector (error
+                correction). None = balanced preset, the detector's default
         """
         self.ai_tool = ai_tool
         self.version = version or "unknown"
         self.required = required
         self.strength = strength
+        self.config = config or get_config("balanced")
         
         # Initialize core components
         self.crypto = CryptoEngine()
@@ -212,11 +219,23 @@ class TruthMarkIntegrator:
                 custom_data=payload_data
             )
             
+            payload_bytes = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+            
+            # Same order as TruthMarkEmbedder: ECC, then encrypt with this
+            # image's key, then frame so detectors read the length from the header
+            if self.config.use_error_correction:
+                ecc = get_error_correction(self.config.get_ecc_symbols())
+                payload_bytes = ecc.encode(payload_bytes)
+            
+            # One-shot per-image key: not worth (or safe) keeping in the
+            # shared engine cache
+            crypto = CryptoEngine(key)
+            encrypted_data, integrity_hash = crypto.encrypt(payload_bytes)
+            
             # Embed watermark
             watermarked, info = self.embedder.embed(
                 image=image,
-                payload=payload,
-                key=key
+                payload=frame_payload(encrypted_data + integrity_hash, key=crypto.get_key_string())
             )
             
             result = IntegrationResult(
@@ -0,0 +1,88 @@
+"""
+TruthMark KeyRing - Multi-key detection
+
+Copyright enforcement often has to test an image against many customer keys.
+A KeyRing holds those keys with their crypto engines built once, so the
+detector can extract candidate bitstreams from an image a single time and
+try every key against the same bytes.
+"""
+
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from ..core.crypto import CryptoEngine
+
+
+class KeyRing:
+    """
+    Ordered set of decryption keys with pre-built crypto engines.
+
+    Keys are tried in insertion order and detection stops at the first key
+    that verifies, so put the most likely keys first.
+
+    Example:
+        >>> keyring = KeyRing({"getty": getty_key, "adobe": adobe_key})
+        >>> detector = TruthMarkDetector(keyring=keyring, mode="copyright")
+        >>> result = detector.detect("suspicious_image.jpg")
+        >>> if result.detected:
+        >>>     print(result.extraction_info["key_id"])
+    """
+
+    def __init__(self, keys: Optional[Union[Dict[str, str], Iterable[str]]] = None):
+        """
+        Initialize key ring.
+
+        Args:
+            keys: Mapping of key_id -> key (base64), or an iterable of keys
+                (each key is its own id)
+        """
+        self._entries: Dict[str, Tuple[str, CryptoEngine]] = {}
+
+        if keys is None:
+            return
+        if isinstance(keys, dict):
+            for key_id, key in keys.items():
+                self.add(key, key_id)
+        else:
+            for key in keys:
+                self.add(key)
+
+    def add(self, key: str, key_id: Optional[str] = None):
+        """
+        Add a key and build its crypto engine.
+
+        Args:
+            key: Decryption key (base64)
+            key_id: Identifier reported on a match. None = the key itself
+        """
+        key_id = key_id if key_id is not None else key
+        self._entries[key_id] = (key, CryptoEngine(key))
+
+    def remove(self, key_id: str):
+        """Remove a key by id."""
+        self._entries.pop(key_id, None)
+
+    def engines(self) -> List[Tuple[str, CryptoEngine]]:
+        """(key_id, engine) pairs in trial order."""
+        return [(key_id, engine) for key_id, (_, engine) in self._entries.items()]
+
+    def keys(self) -> Dict[str, str]:
+        """Mapping of key_id -> key."""
+        return {key_id: key for key_id, (key, _) in self._entries.items()}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __contains__(self, key_id: object) -> bool:
+        return key_id in self._entries
+
+    def __getstate__(self) -> Dict[str, str]:
+        # Engines are rebuilt on unpickling (e.g. once per batch worker)
+        return self.keys()
+
+    def __setstate__(self, state: Dict[str, str]):
+        self._entries = {}
+        for key_id, key in state.items():
+            self.add(key, key_id)
@@ -0,0 +1,273 @@
+"""
+TruthMark Pipeline - Staged batch embedding
+
+embed() runs decode, watermark and encode back to back, so a worker spends
+part of each image waiting on file I/O and codecs. EmbedPipeline splits
+those steps into stages with their own worker threads, connected by bounded
+queues:
+
+    decode (read + PIL decode) -> watermark (payload, saliency, DCT) -> encode (codec + write)
+
+Every stage works on a different image at the same time, so throughput is
+set by the slowest stage rather than the sum of all three. The queues keep
+at most queue_size images between stages, which bounds memory.
+
+PIL codecs, file I/O and the numpy/OpenCV work in the watermark stage
+release the GIL for most of their run time, so stage threads overlap.
+
+Example:
+    >>> pipeline = EmbedPipeline(embedder, decode_workers=2, embed_workers=2, encode_workers=2)
+    >>> results = pipeline.run(image_paths, {"copyright": "ACME"}, output_dir="out")
+    >>> for stats in pipeline.stats():
+    >>>     print(f"{stats.name}: {stats.occupancy:.0%} busy")
+"""
+
+import itertools
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from .embedder import EmbedResult, TruthMarkEmbedder, _EmbedJob
+
+# Marks the end of a stage's input
+_DONE = object()
+
+
+class StageStats(NamedTuple):
+    """Per-stage counters from the last pipeline run."""
+    name: str
+    workers: int
+    items: int
+    busy_seconds: float  # Summed over workers
+    starved_seconds: float  # Waiting for input from the previous stage
+    blocked_seconds: float  # Waiting for room in the next stage's queue
+    occupancy: float  # busy / (wall time x workers); ~1.0 marks the bottleneck
+
+
+class _Stage:
+    """One pipeline stage: workers, counters and the queue it reads from."""
+
+    def __init__(self, name: str, workers: int, queue_size: int):
+        self.name = name
+        self.workers = workers
+        self.inbox: "queue.Queue" = queue.Queue(maxsize=queue_size)
+        self.lock = threading.Lock()
+        self.remaining = workers
+        self.items = 0
+        self.busy = 0.0
+        self.starved = 0.0
+        self.blocked = 0.0
+
+    def record(self, busy: float, starved: float, blocked: float):
+        with self.lock:
+            self.items += 1
+            self.busy += busy
+            self.starved += starved
+            self.blocked += blocked
+
+    def worker_finished(self) -> bool:
+        """Count a worker out; True for the last one."""
+        with self.lock:
+            self.remaining -= 1
+            return self.remaining == 0
+
+
+class EmbedPipeline:
+    """
+    Batch embedder running decode, watermark and encode as concurrent stages.
+
+    Watermark workers each get their own embedder (same key and settings),
+    so configs, crypto engines, saliency detectors and core embedders are
+    never shared between threads. Decode and encode only read the embedder's configuration.
+    """
+
+    STAGES = ("decode", "embed", "encode")
+
+    def __init__(
+        self,
+        embedder: TruthMarkEmbedder,
+        decode_workers: int = 2,
+        embed_workers: int = 1,
+        encode_workers: int = 2,
+        queue_size: int = 8
+    ):
+        """
+        Initialize pipeline.
+
+        Args:
+            embedder: Embedder whose key and settings are used for the batch
+            decode_workers: Threads reading and decoding inputs
+            embed_workers: Threads building payloads and embedding
+            encode_workers: Threads encoding and writing outputs
+            queue_size: Images buffered between consecutive stages
+        """
+        if min(decode_workers, embed_workers, encode_workers, queue_size) < 1:
+            raise ValueError("Stage workers and queue_size must be at least 1")
+
+        self.embedder = embedder
+        self.workers = {"decode": decode_workers, "embed": embed_workers, "encode": encode_workers}
+        self.queue_size = queue_size
+        self._stats: List[StageStats] = []
+
+    def run(
+        self,
+        image_paths: Iterable[Union[str, Path]],
+        copyright_infos: Union[Dict[str, Any], Iterable[Dict[str, Any]]],
+        output_dir: Optional[Union[str, Path]] = None,
+        keep_images: bool = False
+    ) -> List[EmbedResult]:
+        """
+        Embed a batch of images.
+
+        Args:
+            image_paths: Input image paths
+            copyright_infos: Single dict for all, or one per image
+            output_dir: Output directory. None = same as input
+            keep_images: Keep each watermarked array in EmbedResult.image
+                (off by default; see EmbedResult.load_image)
+
+        Returns:
+            List of EmbedResult for each image, in input order
+        """
+        results = dict(self.iter_run(image_paths, copyright_infos, output_dir, keep_images))
+        return [results[index] for index in range(len(results))]
+
+    def iter_run(
+        self,
+        image_paths: Iterable[Union[str, Path]],
+        copyright_infos: Union[Dict[str, Any], Iterable[Dict[str, Any]]],
+        output_dir: Optional[Union[str, Path]] = None,
+        keep_images: bool = False
+    ) -> Iterator[Tuple[int, EmbedResult]]:
+        """
+        Embed images lazily, yielding (input index, EmbedResult) as each finishes.
+
+        Inputs are pulled only as the decode queue has room, so the batch
+        can be an arbitrarily long generator.
+        """
+        if isinstance(copyright_infos, dict):
+            copyright_infos = itertools.repeat(copyright_infos)
+
+        stages = [_Stage(name, self.workers[name], self.queue_size) for name in self.STAGES]
+        results: "queue.Queue" = queue.Queue()
+        embedders = [self.embedder._worker_copy() for _ in range(self.workers["embed"])]
+        functions = {
+            "decode": lambda worker: self.embedder._decode_stage,
+            "embed": lambda worker: embedders[worker]._watermark_stage,
+            "encode": lambda worker: self.embedder._encode_stage,
+        }
+
+        start = time.perf_counter()
+        threads = []
+        for position, stage in enumerate(stages):
+            outbox = stages[position + 1] if position + 1 < len(stages) else None
+            for worker in range(stage.workers):
+                thread = threading.Thread(
+                    target=self._work,
+                    args=(stage, functions[stage.name](worker), outbox, results),
+                    name=f"truthmark-{stage.name}-{worker}",
+                    daemon=True
+                )
+                thread.start()
+                threads.append(thread)
+
+        stop = threading.Event()
+        feeder = threading.Thread(
+            target=self._feed,
+            args=(stages[0], image_paths, copyright_infos, output_dir, keep_images, stop),
+            name="truthmark-feed",
+            daemon=True
+        )
+        feeder.start()
+
+        try:
+            while True:
+                item = results.get()
+                if item is _DONE:
+                    break
+                yield item
+        finally:
+            # If the caller stops early, stop feeding and let in-flight jobs drain
+            stop.set()
+            feeder.join()
+            for thread in threads:
+                thread.join()
+            elapsed = time.perf_counter() - start
+            self._stats = [
+                StageStats(
+                    name=stage.name,
+                    workers=stage.workers,
+                    items=stage.items,
+                    busy_seconds=stage.busy,
+                    starved_seconds=stage.starved,
+                    blocked_seconds=stage.blocked,
+                    occupancy=stage.busy / (elapsed * stage.workers) if elapsed > 0 else 0.0
+                )
+                for stage in stages
+            ]
+
+    def stats(self) -> List[StageStats]:
+        """Per-stage statistics of the last completed run, in stage order."""
+        return list(self._stats)
+
+    def _feed(
+        self,
+        first: _Stage,
+        image_paths: Iterable[Union[str, Path]],
+        copyright_infos: Iterable[Dict[str, Any]],
+        output_dir: Optional[Union[str, Path]],
+        keep_images: bool,
+        stop: threading.Event
+    ):
+        """Push jobs into the first stage, blocking while its queue is full."""
+        try:
+            for index, (img_path, copyright_info) in enumerate(zip(image_paths, copyright_infos)):
+                if stop.is_set():
+                    break
+                img_path = Path(img_path)
+                output_path = None
+                if output_dir:
+                    output_path = Path(output_dir) / f"{img_path.stem}_watermarked{img_path.suffix}"
+                job = _EmbedJob(
+                    input_path=img_path,
+                    copyright_info=copyright_info,
+                    output_path=output_path,
+                    keep_image=keep_images
+                )
+                first.inbox.put((index, job))
+        finally:
+            for _ in range(first.workers):
+                first.inbox.put(_DONE)
+
+    def _work(self, stage: _Stage, function, outbox: Optional[_Stage], results: "queue.Queue"):
+        """Worker loop: take a job, run the stage, hand it on."""
+        while True:
+            waited = time.perf_counter()
+            item = stage.inbox.get()
+            started = time.perf_counter()
+
+            if item is _DONE:
+                # The last worker out closes the next stage (or the run)
+                if stage.worker_finished():
+                    if outbox is None:
+                        results.put(_DONE)
+                    else:
+                        for _ in range(outbox.workers):
+                            outbox.inbox.put(_DONE)
+                return
+
+            index, job = item
+            self.embedder._run_stage(function, job)
+            finished = time.perf_counter()
+
+            if outbox is None:
+                results.put((index, job.result))
+            else:
+                outbox.inbox.put(item)
+            stage.record(
+                busy=finished - started,
+                starved=started - waited,
+                blocked=time.perf_counter() - finished
+            )
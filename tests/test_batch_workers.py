@@ -0,0 +1,73 @@
+"""Batch workers of TruthMarkEmbedder and EmbedPipeline; needs the truthmark core."""
+
+import threading
+
+import numpy as np
+import pytest
+from PIL import Image
+
+pytest.importorskip("truthmark.core.embedder")
+
+from truthmark.sdk.embedder import TruthMarkEmbedder  # noqa: E402
+from truthmark.sdk.pipeline import EmbedPipeline  # noqa: E402
+
+
+@pytest.fixture
+def image_paths(tmp_path):
+    paths = []
+    for index in range(6):
+        path = tmp_path / f"image{index}.png"
+        pixels = np.random.default_rng(index).integers(0, 256, (128, 128, 3), dtype=np.uint8)
+        Image.fromarray(pixels).save(path)
+        paths.append(path)
+    return paths
+
+
+@pytest.fixture
+def watermarking_embedders(monkeypatch):
+    """Embedders that ran the watermark stage, recorded as they run."""
+    seen = []
+    lock = threading.Lock()
+    watermark_stage = TruthMarkEmbedder._watermark_stage
+
+    def recording_stage(self, job):
+        with lock:
+            if all(embedder is not self for embedder in seen):
+                seen.append(self)
+        return watermark_stage(self, job)
+
+    monkeypatch.setattr(TruthMarkEmbedder, "_watermark_stage", recording_stage)
+    return seen
+
+
+def assert_isolated(parent, workers):
+    assert workers
+    for worker in workers:
+        assert worker is not parent
+        assert worker.key == parent.key
+        assert worker.config is not parent.config
+        assert worker.crypto is not parent.crypto
+        assert worker.embedder is not parent.embedder
+    assert len({id(worker.crypto) for worker in workers}) == len(workers)
+    assert len({id(worker.config) for worker in workers}) == len(workers)
+
+
+@pytest.mark.parametrize("embed_workers", [1, 3])
+def test_pipeline_workers_share_nothing_with_the_parent(image_paths, tmp_path, watermarking_embedders, embed_workers):
+    parent = TruthMarkEmbedder()
+    pipeline = EmbedPipeline(parent, embed_workers=embed_workers)
+
+    results = pipeline.run(image_paths, {"copyright": "ACME"}, output_dir=tmp_path)
+
+    assert all(result.success for result in results)
+    assert len(watermarking_embedders) <= embed_workers
+    assert_isolated(parent, watermarking_embedders)
+
+
+def test_thread_batch_workers_share_nothing_with_the_parent(image_paths, tmp_path, watermarking_embedders):
+    parent = TruthMarkEmbedder()
+
+    results = parent.embed_batch(image_paths, {"copyright": "ACME"}, output_dir=tmp_path, workers=3, executor="thread")
+
+    assert all(result.success for result in results)
+    assert_isolated(parent, watermarking_embedders)
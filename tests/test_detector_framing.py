@@ -0,0 +1,166 @@
+"""Detector handling of framed and legacy (unframed) streams; needs the truthmark core."""
+
+import gc
+
+import numpy as np
+import pytest
+from PIL import Image
+
+pytest.importorskip("truthmark.core.embedder")
+
+from truthmark.core.crypto import CryptoEngine  # noqa: E402
+from truthmark.sdk import detector as detector_module  # noqa: E402
+from truthmark.sdk import embedder as embedder_module  # noqa: E402
+from truthmark.sdk.detector import TruthMarkDetector  # noqa: E402
+from truthmark.sdk.embedder import TruthMarkEmbedder  # noqa: E402
+from truthmark.sdk.framing import FrameHeader  # noqa: E402
+from truthmark.sdk.keyring import KeyRing  # noqa: E402
+
+
+@pytest.fixture
+def source_path(tmp_path):
+    path = tmp_path / "source.png"
+    pixels = np.random.default_rng(0).integers(0, 256, (512, 512, 3), dtype=np.uint8)
+    Image.fromarray(pixels).save(path)
+    return path
+
+
+def embed(source_path, output_path, copyright_info=None):
+    result = TruthMarkEmbedder().embed(source_path, copyright_info or {"copyright": "ACME"}, output_path)
+    assert result.success, result.error_message
+    return result.key
+
+
+@pytest.fixture
+def legacy_image(source_path, tmp_path, monkeypatch):
+    """(path, key) of an image embedded without a format header, as before framing."""
+    body_lengths = []
+
+    def unframed(body, key=None):
+        body_lengths.append(len(body))
+        return body
+
+    output_path = tmp_path / "legacy.png"
+    with monkeypatch.context() as patch:
+        patch.setattr(embedder_module, "frame_payload", unframed)
+        # Legacy streams are only found at the detector's candidate sizes
+        for padding in range(64):
+            key = embed(source_path, output_path, {"copyright": "ACME" + " " * padding})
+            if body_lengths[-1] in TruthMarkDetector.EMBEDDED_SIZES_TO_TRY:
+                return output_path, key
+    pytest.fail("No legacy payload size matched a detector candidate size")
+
+
+@pytest.fixture
+def framed_image(source_path, tmp_path):
+    output_path = tmp_path / "framed.png"
+    return output_path, embed(source_path, output_path)
+
+
+def test_framed_image_is_read_from_its_header(framed_image):
+    path, key = framed_image
+    result = TruthMarkDetector(key=key).detect(path)
+    assert result.detected
+    assert result.extraction_info["format_version"] == 2
+
+
+def test_legacy_image_is_detected(legacy_image):
+    path, key = legacy_image
+    result = TruthMarkDetector(key=key).detect(path)
+    assert result.detected
+    assert result.extraction_info["format_version"] == 0
+
+
+@pytest.mark.parametrize(
+    "body_length, exact",
+    [
+        (30169, False),  # Noisy header declaring more bits than the image holds
+        (30169, True),  # Exact header that cannot be read back
+        (40, False),  # Noisy header whose declared body fails to decode
+    ],
+)
+def test_legacy_stream_parsing_as_header_falls_back_to_size_search(legacy_image, monkeypatch, body_length, exact):
+    # About 1 in 60,000 legacy streams start with bytes that parse as a header
+    header = FrameHeader(version=1, size=7, body_length=body_length, tag=None, exact=exact)
+    monkeypatch.setattr(detector_module, "parse_header", lambda data: header)
+
+    path, key = legacy_image
+    result = TruthMarkDetector(key=key).detect(path)
+
+    assert result.detected
+    assert result.extraction_info["format_version"] == 0
+
+
+def test_exact_header_that_fails_is_not_retried_as_legacy(framed_image, monkeypatch):
+    def no_legacy_search(*args, **kwargs):
+        raise AssertionError("legacy size search ran for an exactly framed image")
+
+    monkeypatch.setattr(TruthMarkDetector, "_size_hypotheses", no_legacy_search)
+
+    path, _ = framed_image
+    result = TruthMarkDetector(key=CryptoEngine().get_key_string()).detect(path)
+
+    assert not result.detected
+    assert result.extraction_info["rejections"]["tag"] == 1
+
+
+def test_tag_is_keyed_with_the_engines_key_string(source_path, tmp_path, monkeypatch):
+    # A core that normalizes keys must not break the tag: both sides use get_key_string()
+    key = CryptoEngine().get_key_string()
+    get_key_string = CryptoEngine.get_key_string
+    monkeypatch.setattr(CryptoEngine, "get_key_string", lambda self: "normalized:" + get_key_string(self))
+
+    output_path = tmp_path / "framed.png"
+    result = TruthMarkEmbedder(key=key).embed(source_path, {"copyright": "ACME"}, output_path)
+    assert result.success, result.error_message
+
+    detected = TruthMarkDetector(key=key).detect(output_path)
+    assert detected.detected
+    assert detected.extraction_info["format_version"] == 2
+
+
+def test_tag_keys_live_only_as_long_as_their_engines(framed_image):
+    path, key = framed_image
+    keyring = KeyRing({"other": CryptoEngine().get_key_string(), "owner": key})
+    detector = TruthMarkDetector(keyring=keyring)
+
+    result = detector.detect(path)
+    assert result.detected
+    assert result.extraction_info["key_id"] == "owner"
+    assert len(detector._tag_keys) == 2
+
+    keyring.remove("other")
+    gc.collect()
+    assert len(detector._tag_keys) == 1
+
+
+@pytest.mark.parametrize("height, width", [(64, 64), (512, 512), (480, 640), (1080, 1920)])
+def test_location_selection_is_prefix_stable(height, width):
+    # The detector reads the header (and incremental_search every legacy size)
+    # from a prefix of the locations selected for a longer stream
+    from truthmark.core.embedder import WatermarkEmbedder
+
+    def select(n):
+        return np.asarray(
+            WatermarkEmbedder._select_embedding_locations(height, width, n, saliency_map=None, block_size=8)
+        )[:n]
+
+    capacity = (height // 8) * (width // 8) * TruthMarkDetector.COEFFICIENTS_PER_BLOCK
+    full = select(capacity)
+    for n in sorted({1, 8, 56, 88, 800, capacity // 3, capacity - 1}):
+        assert np.array_equal(select(n), full[:n])
+
+
+def test_header_not_repeated_in_full_length_locations_is_not_trusted(framed_image, monkeypatch):
+    # If location selection were not prefix-stable, the header read from the
+    # short selection would not match the one in the full-length stream
+    path, key = framed_image
+    headers = iter([FrameHeader(version=2, size=11, body_length=150, tag=b"\0" * 4), None])
+    monkeypatch.setattr(detector_module, "parse_header", lambda data: next(headers))
+    monkeypatch.setattr(TruthMarkDetector, "_size_hypotheses", lambda self, plane, sizes: iter(()))
+
+    result = TruthMarkDetector(key=key).detect(path)
+
+    assert not result.detected
+    assert result.extraction_info["rejections"]["header"] == 1
+    assert result.extraction_info["rejections"]["tag"] == 0
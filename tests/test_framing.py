@@ -0,0 +1,144 @@
+"""
+Tests for the embedded payload format (sdk/framing.py).
+
+framing only depends on the standard library, so it is loaded straight from
+its file and the tests run without the rest of the truthmark package.
+"""
+
+import importlib.util
+import struct
+from pathlib import Path
+
+import pytest
+
+_spec = importlib.util.spec_from_file_location("framing", Path(__file__).resolve().parents[1] / "sdk" / "framing.py")
+framing = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(framing)
+
+KEY = "dGVzdC1rZXktMzItYnl0ZXMtbG9uZy4uLi4uLi4uLi4="
+OTHER_KEY = "b3RoZXIta2V5LTMyLWJ5dGVzLWxvbmcuLi4uLi4uLi4="
+BODY = bytes(range(256)) * 2 + b"integrity-hash-32-bytes-long...."
+
+
+def flip_bits(data: bytes, *bits: int) -> bytes:
+    """Flip the given bit positions (0 = MSB of the first byte)."""
+    flipped = bytearray(data)
+    for bit in bits:
+        flipped[bit // 8] ^= 0x80 >> (bit % 8)
+    return bytes(flipped)
+
+
+@pytest.mark.parametrize("version", framing.SUPPORTED_VERSIONS)
+def test_round_trip(version):
+    stream = framing.frame_payload(BODY, key=KEY, version=version)
+    header = framing.parse_header(stream)
+
+    assert header is not None
+    assert header.version == version
+    assert header.body_length == len(BODY)
+    assert stream[header.size:] == BODY
+    assert framing.verify_tag(header, stream[header.size:], framing.derive_tag_key(KEY))
+
+
+def test_header_sizes():
+    v1 = framing.parse_header(framing.frame_payload(BODY, version=1))
+    v2 = framing.parse_header(framing.frame_payload(BODY, key=KEY, version=2))
+
+    assert v1.size == 9 and v1.tag is None
+    assert v2.size == 13 and len(v2.tag) == framing.TAG_SIZE
+    assert framing.HEADER_SIZE == v2.size
+
+
+@pytest.mark.parametrize("bits", [(0,), (3, 12), (7, 15)])
+def test_magic_tolerates_two_bit_errors(bits):
+    stream = flip_bits(framing.frame_payload(BODY, key=KEY), *bits)
+    header = framing.parse_header(stream)
+
+    assert header is not None
+    assert header.body_length == len(BODY)
+
+
+def test_magic_rejects_three_bit_errors():
+    stream = flip_bits(framing.frame_payload(BODY, key=KEY), 0, 5, 11)
+
+    assert framing.parse_header(stream) is None
+
+
+def test_unframed_stream_is_not_a_header():
+    assert framing.parse_header(b"\x00" * framing.HEADER_SIZE) is None
+    assert framing.parse_header(BODY[:framing.HEADER_SIZE]) is None
+
+
+def test_unsupported_version_is_rejected():
+    stream = bytearray(framing.frame_payload(BODY, key=KEY))
+    stream[2] = 9
+
+    assert framing.parse_header(bytes(stream)) is None
+
+
+def test_length_majority_vote_outvotes_one_corrupted_copy():
+    stream = framing.frame_payload(BODY, key=KEY)
+    corrupted = stream[:3] + struct.pack(">H", 0xBEEF) + stream[5:]
+
+    assert framing.parse_header(corrupted).body_length == len(BODY)
+
+
+def test_length_majority_vote_is_bitwise():
+    # Every copy is wrong, but in different bits: the vote still recovers it
+    stream = framing.frame_payload(BODY, key=KEY)
+    length_bits = 3 * 8
+    corrupted = flip_bits(stream, length_bits + 15, length_bits + 16 + 14, length_bits + 32 + 13)
+
+    assert framing.parse_header(corrupted).body_length == len(BODY)
+
+
+def test_zero_length_is_rejected():
+    stream = framing.frame_payload(BODY, key=KEY)
+    zeroed = stream[:3] + b"\x00" * 6 + stream[9:]
+
+    assert framing.parse_header(zeroed) is None
+
+
+def test_wrong_key_fails_tag():
+    stream = framing.frame_payload(BODY, key=KEY)
+    header = framing.parse_header(stream)
+
+    assert not framing.verify_tag(header, stream[header.size:], framing.derive_tag_key(OTHER_KEY))
+
+
+def test_corrupted_body_fails_tag():
+    stream = framing.frame_payload(BODY, key=KEY)
+    header = framing.parse_header(stream)
+    body = flip_bits(stream[header.size:], 100)
+
+    assert not framing.verify_tag(header, body, framing.derive_tag_key(KEY))
+
+
+def test_untagged_header_always_verifies():
+    stream = framing.frame_payload(BODY, version=1)
+    header = framing.parse_header(stream)
+
+    assert framing.verify_tag(header, stream[header.size:], framing.derive_tag_key(OTHER_KEY))
+
+
+@pytest.mark.parametrize("length", [0, 1, 8])
+def test_truncated_below_v1_header(length):
+    stream = framing.frame_payload(BODY, key=KEY)
+
+    assert framing.parse_header(stream[:length]) is None
+
+
+@pytest.mark.parametrize("length", [9, 12])
+def test_truncated_v2_header(length):
+    stream = framing.frame_payload(BODY, key=KEY)
+
+    assert framing.parse_header(stream[:length]) is None
+
+
+def test_frame_payload_errors():
+    with pytest.raises(ValueError):
+        framing.frame_payload(BODY, version=2)  # Tag needs the key
+    with pytest.raises(ValueError):
+        framing.frame_payload(BODY, key=KEY, version=3)
+    with pytest.raises(ValueError):
+        framing.frame_payload(b"\x00" * 0x10000, key=KEY)